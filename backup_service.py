@@ -15,14 +15,44 @@ Naming convention:  YYYY-MM-DD_daily.zip  /  _weekly.zip  /  _monthly.zip
 
 from __future__ import annotations
 
-import shutil
-import tempfile
+import heapq
+import json
+import mmap
+import os
+import queue
+import re
+import struct
+import threading
+import time
 import zipfile
-from collections import defaultdict
+import zlib
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
 from datetime import datetime, date, timedelta, timezone
 
+# Optional SIMD-accelerated DEFLATE backends (2-4x faster than stdlib
+# zlib, including PCLMULQDQ-accelerated CRC32).  Both are drop-in
+# compatible with the zlib API used here; stdlib zlib is the fallback.
+try:
+    from isal import isal_zlib as _zlib
+except ImportError:
+    try:
+        from zlib_ng import zlib_ng as _zlib
+    except ImportError:
+        _zlib = zlib
+
+# isa-l only offers levels 0-3; its level 3 roughly matches zlib level 6.
+_DEFLATE_LEVEL = min(6, getattr(_zlib, "ISAL_BEST_COMPRESSION", 6))
+
 BACKUP_EXTENSIONS = {".db", ".xml", ".xmlbackup", ".bac", ".dat", ".json"}
+# Dual-case tuple for C-level str.endswith matching in the scan loop;
+# covers the common all-lower/all-upper suffixes without allocating a
+# lowered string per file.  Mixed-case stragglers hit the set fallback.
+_SUFFIX_TUPLE = tuple(s for ext in sorted(BACKUP_EXTENSIONS)
+                      for s in (ext, ext.upper()))
 TIERS = ("daily", "weekly", "monthly")
 
 
@@ -30,24 +60,316 @@ TIERS = ("daily", "weekly", "monthly")
 # Discover files to back up
 # ---------------------------------------------------------------------------
 
-def find_backup_files(data_dir: Path) -> list[Path]:
-    """Recursively find files in *data_dir* matching BACKUP_EXTENSIONS."""
-    if not data_dir.exists():
-        return []
-    return [
-        p for p in data_dir.rglob("*")
-        if p.is_file() and p.suffix.lower() in BACKUP_EXTENSIONS
-    ]
+_SCAN_WORKERS = min(32, (os.cpu_count() or 4) * 4)
+
+
+def iter_backup_files(data_dir: Path):
+    """
+    Yield ``(path, size, mtime_ns)`` for files in *data_dir* matching
+    BACKUP_EXTENSIONS, streaming results as the scan finds them.
+
+    Directories are scanned by a small pool of threads pulling from a
+    shared queue, so many readdir calls are in flight at once -- on
+    spinning disks and network shares per-directory latency dominates a
+    serial walk. DirEntry.is_file/is_dir use the cached directory data
+    (no extra syscall on most platforms) and plain string paths avoid a
+    Path object per node.  Sizes come from DirEntry.stat() so consumers
+    never need to stat the files again.  Because matches are yielded as
+    they are found, a consumer can start copying/compressing while the
+    walk is still running instead of waiting on the full file list.
+    """
+    found: queue.Queue[tuple[str, int, int] | None] = queue.Queue()
+    dirs: queue.Queue[str | None] = queue.Queue()
+    dirs.put(str(data_dir))
+    # Number of queued-but-unfinished directories; the worker that drops
+    # it to zero releases the pool and signals end-of-stream.
+    outstanding = 1
+    state_lock = threading.Lock()
+
+    def scan():
+        nonlocal outstanding
+        while True:
+            d = dirs.get()
+            if d is None:
+                break
+            try:
+                with os.scandir(d) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            with state_lock:
+                                outstanding += 1
+                            dirs.put(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            name = entry.name
+                            if name.endswith(_SUFFIX_TUPLE) or (
+                                    (dot := name.rfind(".")) != -1
+                                    and name[dot:].lower() in BACKUP_EXTENSIONS):
+                                st = entry.stat(follow_symlinks=False)
+                                found.put(
+                                    (entry.path, st.st_size, st.st_mtime_ns))
+            except OSError:
+                pass
+            with state_lock:
+                outstanding -= 1
+                finished = outstanding == 0
+            if finished:
+                for _ in range(_SCAN_WORKERS):
+                    dirs.put(None)
+                found.put(None)
+
+    threads = [threading.Thread(target=scan, daemon=True)
+               for _ in range(_SCAN_WORKERS)]
+    for t in threads:
+        t.start()
+    try:
+        while (item := found.get()) is not None:
+            yield item
+    finally:
+        for t in threads:
+            t.join()
+
+
+def find_backup_files(data_dir: Path) -> list[tuple[str, int, int]]:
+    """Materialized form of :func:`iter_backup_files`."""
+    return list(iter_backup_files(data_dir))
 
 
 # ---------------------------------------------------------------------------
 # Create a backup
 # ---------------------------------------------------------------------------
 
+# Files whose first 4 KiB barely shrink under fast DEFLATE are treated as
+# already compressed and stored uncompressed in the zip.
+_ENTROPY_SAMPLE = 4096
+_ENTROPY_RATIO = 0.95
+
+
+def _choose_compress_type(sample: bytes, file_size: int) -> int:
+    """
+    Pick ZIP_DEFLATED or ZIP_STORED for a payload.
+
+    Spending CPU on DEFLATE for near-random bytes (encrypted blobs,
+    already-compressed SQLite pages) is pure waste, so probe the file's
+    first 4 KiB with a level-1 compress and store it when the sample
+    barely shrinks.  Small files always go through DEFLATE -- the probe
+    would cost as much as the real thing.
+    """
+    if file_size <= _ENTROPY_SAMPLE or not sample:
+        return zipfile.ZIP_DEFLATED
+    if len(_zlib.compress(sample, 1)) / len(sample) > _ENTROPY_RATIO:
+        return zipfile.ZIP_STORED
+    return zipfile.ZIP_DEFLATED
+
+
+# One read buffer per worker thread, reused across all files it handles.
+_READ_BUF_SIZE = 1 << 20
+_tls = threading.local()
+
+
+def _thread_buffer() -> tuple[bytearray, memoryview]:
+    buf = getattr(_tls, "buf", None)
+    if buf is None:
+        buf = bytearray(_READ_BUF_SIZE)
+        _tls.buf = buf
+        _tls.view = memoryview(buf)
+    return _tls.buf, _tls.view
+
+
+# Files above this size are mmap'd instead of read, letting the OS page
+# contents in lazily while the compressor walks the mapping.
+_MMAP_THRESHOLD = 128 * 1024
+
+
+def _compress_member_mmap(src: str, arcname: str) -> tuple[zipfile.ZipInfo, bytes]:
+    """mmap-backed variant of _compress_member for large files."""
+    with open(src, "rb") as f, \
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        view = memoryview(mm)
+        try:
+            sample = bytes(view[:_ENTROPY_SAMPLE])
+            compress_type = _choose_compress_type(sample, len(mm))
+            crc = _zlib.crc32(view)
+            if compress_type == zipfile.ZIP_DEFLATED:
+                compressor = _zlib.compressobj(_DEFLATE_LEVEL, zlib.DEFLATED, -15)
+                chunks = [compressor.compress(view[off:off + _READ_BUF_SIZE])
+                          for off in range(0, len(mm), _READ_BUF_SIZE)]
+                chunks.append(compressor.flush())
+                payload = b"".join(chunks)
+            else:
+                payload = bytes(view)
+            file_size = len(mm)
+        finally:
+            view.release()
+    zinfo = zipfile.ZipInfo.from_file(src, arcname)
+    zinfo.compress_type = compress_type
+    zinfo.CRC = crc
+    zinfo.file_size = file_size
+    zinfo.compress_size = len(payload)
+    return zinfo, payload
+
+
+def _compress_member(src: str, arcname: str, size: int) -> tuple[zipfile.ZipInfo, bytes]:
+    """
+    Read *src* and produce its in-memory zip payload.
+
+    Runs on a worker thread -- zlib releases the GIL, so compression of
+    multiple files proceeds in parallel.  Large files are mmap'd and the
+    compressor walks the mapping; smaller ones are read unbuffered into
+    a reused 1 MiB buffer and fed to the compressor (and CRC)
+    incrementally.  Either way only the compressed output is held in
+    memory and high-entropy files are stored as-is instead of deflated.
+    Returns the fully-populated ZipInfo and the payload bytes.
+    """
+    if size > _MMAP_THRESHOLD:
+        try:
+            return _compress_member_mmap(src, arcname)
+        except (OSError, ValueError):
+            pass  # fall through to the read loop (e.g. file shrank to 0)
+    buf, view = _thread_buffer()
+    crc = 0
+    file_size = 0
+    chunks: list[bytes] = []
+    with open(src, "rb", buffering=0) as f:
+        n = f.readinto(buf)
+        sample = bytes(view[:min(n, _ENTROPY_SAMPLE)])
+        compress_type = _choose_compress_type(sample, size)
+        compressor = (_zlib.compressobj(_DEFLATE_LEVEL, zlib.DEFLATED, -15)
+                      if compress_type == zipfile.ZIP_DEFLATED else None)
+        while n:
+            chunk = view[:n]
+            crc = _zlib.crc32(chunk, crc)
+            file_size += n
+            if compressor is not None:
+                out = compressor.compress(chunk)
+                if out:
+                    chunks.append(out)
+            else:
+                chunks.append(bytes(chunk))
+            n = f.readinto(buf)
+    if compressor is not None:
+        chunks.append(compressor.flush())
+    payload = b"".join(chunks)
+    zinfo = zipfile.ZipInfo.from_file(src, arcname)
+    zinfo.compress_type = compress_type
+    zinfo.CRC = crc
+    zinfo.file_size = file_size
+    zinfo.compress_size = len(payload)
+    return zinfo, payload
+
+
+# Sidecar manifest recording what the newest backup zip contains, so an
+# unchanged file (same size + mtime_ns) can be copied from that zip as raw
+# compressed bytes instead of being re-read and re-deflated from source.
+_MANIFEST_NAME = ".manifest.json"
+
+# Footer member naming each entry's (data_offset, compress_size,
+# file_size, crc32, compress_type) so restores can be parallelized.
+_INDEX_NAME = "@PARALLEL_INDEX.json"
+
+
+def _load_manifest(backup_dir: Path) -> dict:
+    try:
+        with open(backup_dir / _MANIFEST_NAME, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+        if isinstance(manifest, dict) and isinstance(manifest.get("files"), dict):
+            return manifest
+    except (OSError, ValueError):
+        pass
+    return {}
+
+
+def _save_manifest(backup_dir: Path, zip_name: str, entries: dict[str, list[int]]):
+    try:
+        with open(backup_dir / _MANIFEST_NAME, "w", encoding="utf-8") as f:
+            json.dump({"zip": zip_name, "files": entries}, f)
+    except OSError:
+        pass
+
+
+def _read_raw_payload(zf: zipfile.ZipFile, zinfo: zipfile.ZipInfo) -> bytes:
+    """Read an entry's compressed bytes from *zf* without inflating them."""
+    fp = zf.fp
+    fp.seek(zinfo.header_offset)
+    fheader = struct.unpack(zipfile.structFileHeader,
+                            fp.read(zipfile.sizeFileHeader))
+    fp.seek(zinfo.header_offset + zipfile.sizeFileHeader
+            + fheader[zipfile._FH_FILENAME_LENGTH]
+            + fheader[zipfile._FH_EXTRA_FIELD_LENGTH])
+    return fp.read(zinfo.compress_size)
+
+
+def _clone_zipinfo(zinfo: zipfile.ZipInfo) -> zipfile.ZipInfo:
+    """Copy the fields _write_precompressed needs from a read-side ZipInfo."""
+    clone = zipfile.ZipInfo(zinfo.filename, zinfo.date_time)
+    clone.compress_type = zinfo.compress_type
+    clone.CRC = zinfo.CRC
+    clone.file_size = zinfo.file_size
+    clone.compress_size = zinfo.compress_size
+    clone.external_attr = zinfo.external_attr
+    clone.create_system = zinfo.create_system
+    return clone
+
+
+def _open_previous_zip(backup_dir: Path,
+                       zip_name: str) -> tuple[zipfile.ZipFile | None, dict, str]:
+    """
+    Open the zip recorded in the manifest for raw-payload reuse.
+
+    A same-day re-run would truncate the very file we need to read from,
+    so in that case the old zip is first renamed to a ``.prev`` sidecar
+    (restored by the caller on failure, removed on success).  Returns
+    ``(zipfile or None, manifest file map, sidecar path or "")``.
+    """
+    manifest = _load_manifest(backup_dir)
+    prev_name = manifest.get("zip", "")
+    if not prev_name:
+        return None, {}, ""
+    prev_path = os.path.join(backup_dir, prev_name)
+    prev_tmp = ""
+    if prev_name == zip_name:
+        try:
+            os.replace(prev_path, prev_path + ".prev")
+        except OSError:
+            return None, {}, ""
+        prev_path = prev_tmp = prev_path + ".prev"
+    try:
+        return zipfile.ZipFile(prev_path, "r"), manifest.get("files", {}), prev_tmp
+    except (OSError, zipfile.BadZipFile):
+        return None, {}, prev_tmp
+
+
+def _write_precompressed(zf: zipfile.ZipFile, zinfo: zipfile.ZipInfo, data: bytes) -> int:
+    """
+    Append an already-compressed entry to *zf* without re-deflating.
+
+    ZipFile has no public API for pre-compressed payloads, so this emits
+    the local file header and raw bytes directly and registers the entry
+    for the central directory.  CRC/file_size/compress_size must already
+    be set on *zinfo*.  Returns the offset of the entry's compressed
+    data within the archive (for the parallel-restore index).
+    """
+    zip64 = (zinfo.file_size > zipfile.ZIP64_LIMIT
+             or zinfo.compress_size > zipfile.ZIP64_LIMIT)
+    zinfo.header_offset = zf.fp.tell()
+    zf.fp.write(zinfo.FileHeader(zip64))
+    data_offset = zf.fp.tell()
+    zf.fp.write(data)
+    zf.start_dir = zf.fp.tell()
+    zf.filelist.append(zinfo)
+    zf.NameToInfo[zinfo.filename] = zinfo
+    return data_offset
+
+
 def run_backup(data_dir: Path, backup_dir: Path) -> dict:
     """
-    Copy every matching file from *data_dir* into a temporary staging folder,
-    then zip the staged copy into a daily backup zip under *backup_dir*.
+    Zip every matching file from *data_dir* directly into a daily backup
+    zip under *backup_dir*.
+
+    Discovery and compression run as one pipeline: the scan threads feed
+    files into the compression pool as they are found, so the full file
+    list is never materialized and the first bytes hit the zip while the
+    walk is still running.  Unchanged files (per the manifest) are
+    copied raw from the previous zip without recompression.
 
     The original data files are **never** moved or modified -- only read.
 
@@ -64,84 +386,220 @@ def run_backup(data_dir: Path, backup_dir: Path) -> dict:
     zip_name = f"{today}_daily.zip"
     dest = backup_dir / zip_name
 
-    files = find_backup_files(data_dir)
-    if not files:
-        return {"dest": dest, "file_count": 0, "total_bytes": 0,
-                "error": "No files found to back up."}
-
     backup_dir.mkdir(parents=True, exist_ok=True)
 
+    prev_zf, prev_files, prev_tmp = _open_previous_zip(backup_dir, zip_name)
+
+    file_count = 0
     total_bytes = 0
-    tmp_dir = None
+    # arcname -> [size, mtime_ns]; doubles as the next manifest contents.
+    stats: dict[str, list[int]] = {}
+    index: dict[str, list[int]] = {}
     try:
-        tmp_dir = Path(tempfile.mkdtemp(prefix="jeveassets_backup_"))
-
-        for src in files:
-            rel = src.relative_to(data_dir)
-            staged = tmp_dir / rel
-            staged.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(src, staged)
-            total_bytes += src.stat().st_size
-
-        with zipfile.ZipFile(dest, "w", zipfile.ZIP_DEFLATED) as zf:
-            for staged_file in tmp_dir.rglob("*"):
-                if staged_file.is_file():
-                    rel = staged_file.relative_to(tmp_dir)
-                    zf.write(staged_file, arcname=str(rel))
+        with zipfile.ZipFile(dest, "w", zipfile.ZIP_DEFLATED) as zf, \
+                ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+            # In-flight compression futures, written out in submission
+            # order; bounded so a fast scan cannot pile up payloads.
+            pending: deque = deque()
+            max_pending = (os.cpu_count() or 4) * 2
+
+            def write_entry(zinfo: zipfile.ZipInfo, payload: bytes):
+                offset = _write_precompressed(zf, zinfo, payload)
+                index[zinfo.filename] = [offset, zinfo.compress_size,
+                                         zinfo.file_size, zinfo.CRC,
+                                         zinfo.compress_type]
+
+            def drain(limit: int):
+                while pending and (len(pending) > limit or pending[0].done()):
+                    write_entry(*pending.popleft().result())
+
+            for src, size, mtime in iter_backup_files(data_dir):
+                arcname = os.path.relpath(src, data_dir).replace(os.sep, "/")
+                stats[arcname] = [size, mtime]
+                file_count += 1
+                total_bytes += size
+                if prev_zf is not None and prev_files.get(arcname) == [size, mtime]:
+                    try:
+                        prev_info = prev_zf.getinfo(arcname)
+                        write_entry(_clone_zipinfo(prev_info),
+                                    _read_raw_payload(prev_zf, prev_info))
+                        continue
+                    except (KeyError, OSError, zipfile.BadZipFile):
+                        pass
+                pending.append(pool.submit(_compress_member, src, arcname, size))
+                drain(max_pending)
+            drain(0)
+            if file_count:
+                # Tiny footer member so a restore can hand each worker a
+                # raw byte range without walking local headers first.
+                zf.writestr(_INDEX_NAME, json.dumps(index))
     except Exception as e:
+        if prev_zf is not None:
+            prev_zf.close()
+        if prev_tmp:
+            try:
+                os.replace(prev_tmp, dest)
+            except OSError:
+                pass
         return {"dest": dest, "file_count": 0, "total_bytes": 0,
                 "error": str(e)}
-    finally:
-        if tmp_dir and tmp_dir.exists():
-            shutil.rmtree(tmp_dir, ignore_errors=True)
 
-    return {"dest": dest, "file_count": len(files), "total_bytes": total_bytes,
+    if prev_zf is not None:
+        prev_zf.close()
+
+    if file_count == 0:
+        try:
+            os.unlink(dest)
+        except OSError:
+            pass
+        if prev_tmp:
+            try:
+                os.replace(prev_tmp, dest)
+            except OSError:
+                pass
+        return {"dest": dest, "file_count": 0, "total_bytes": 0,
+                "error": "No files found to back up."}
+
+    if prev_tmp:
+        try:
+            os.unlink(prev_tmp)
+        except OSError:
+            pass
+    _save_manifest(backup_dir, zip_name, stats)
+
+    return {"dest": dest, "file_count": file_count, "total_bytes": total_bytes,
             "error": None}
 
 
+# ---------------------------------------------------------------------------
+# Parallel restore
+# ---------------------------------------------------------------------------
+
+def _entry_data_offset(fp, zinfo: zipfile.ZipInfo) -> int:
+    """Locate an entry's compressed data by parsing its local header."""
+    fp.seek(zinfo.header_offset)
+    fheader = struct.unpack(zipfile.structFileHeader,
+                            fp.read(zipfile.sizeFileHeader))
+    return (zinfo.header_offset + zipfile.sizeFileHeader
+            + fheader[zipfile._FH_FILENAME_LENGTH]
+            + fheader[zipfile._FH_EXTRA_FIELD_LENGTH])
+
+
+def parallel_restore(zip_path: Path, out_dir: Path, workers: int | None = None) -> int:
+    """
+    Extract a backup zip with one worker per entry byte range.
+
+    Because every member is an independent deflate stream, each worker
+    can raw-inflate its slice of the mmap'd archive directly with
+    zlib.decompressobj(-15), bypassing per-entry ZipFile overhead.  The
+    @PARALLEL_INDEX.json footer written by run_backup supplies the byte
+    ranges; zips without it fall back to reading the local headers.
+    Returns the number of files restored.
+    """
+    out_dir = str(out_dir)
+    with zipfile.ZipFile(zip_path, "r") as zf:
+        try:
+            index = {
+                name: tuple(entry)
+                for name, entry in json.loads(zf.read(_INDEX_NAME)).items()
+            }
+        except (KeyError, ValueError):
+            index = {
+                zi.filename: (_entry_data_offset(zf.fp, zi), zi.compress_size,
+                              zi.file_size, zi.CRC, zi.compress_type)
+                for zi in zf.infolist()
+                if zi.filename != _INDEX_NAME and not zi.is_dir()
+            }
+
+    with open(zip_path, "rb") as f, \
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+
+        def restore_one(item: tuple[str, tuple]) -> None:
+            arcname, (offset, csize, usize, crc, ctype) = item
+            raw = mm[offset:offset + csize]
+            if ctype == zipfile.ZIP_DEFLATED:
+                data = _zlib.decompressobj(-15).decompress(raw)
+            else:
+                data = raw
+            if len(data) != usize or _zlib.crc32(data) != crc:
+                raise zipfile.BadZipFile(f"corrupt entry: {arcname}")
+            dst = os.path.join(out_dir, arcname)
+            os.makedirs(os.path.dirname(dst) or out_dir, exist_ok=True)
+            with open(dst, "wb") as out:
+                out.write(data)
+
+        # Entries with unsafe names never come from our own writer; skip
+        # them rather than extracting outside out_dir.  Normalize both
+        # separators first -- restores happen on Windows, where a
+        # tampered archive could smuggle "..\evil" or a drive-absolute
+        # name past a forward-slash-only check.
+        def _is_safe(name: str) -> bool:
+            parts = name.replace("\\", "/").split("/")
+            return (".." not in parts
+                    and parts[0] != ""      # rooted ("/x", "\x", UNC)
+                    and ":" not in parts[0])  # drive letter ("C:...")
+
+        safe = {name: entry for name, entry in index.items()
+                if _is_safe(name)}
+        with ThreadPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+            for _ in pool.map(restore_one, safe.items()):
+                pass
+    return len(safe)
+
+
 # ---------------------------------------------------------------------------
 # Should a backup run now?
 # ---------------------------------------------------------------------------
 
+@lru_cache(maxsize=4)
+def _parse_iso_epoch(iso: str) -> float:
+    """
+    Parse an ISO timestamp into epoch seconds (UTC assumed when naive).
+    Returns -inf for empty / unparseable input, meaning "backup now".
+    """
+    try:
+        dt = datetime.fromisoformat(iso)
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=timezone.utc)
+        return dt.timestamp()
+    except (ValueError, TypeError):
+        return float("-inf")
+
+
 def should_backup(last_backup_iso: str, interval_hours: int = 24) -> bool:
     """
     Return True if *interval_hours* have elapsed since *last_backup_iso*
     (ISO timestamp), or if the string is empty / unparseable.
+
+    The string is parsed at most once (cached), so polling callers only
+    pay a time.time() call per check.
     """
-    if not last_backup_iso:
-        return True
-    try:
-        last_dt = datetime.fromisoformat(last_backup_iso)
-        if last_dt.tzinfo is None:
-            last_dt = last_dt.replace(tzinfo=timezone.utc)
-        elapsed = (datetime.now(timezone.utc) - last_dt).total_seconds() / 3600
-        return elapsed >= interval_hours
-    except (ValueError, TypeError):
-        return True
+    last_epoch = _parse_iso_epoch(last_backup_iso)
+    return (time.time() - last_epoch) / 3600 >= interval_hours
 
 
 # ---------------------------------------------------------------------------
 # Tiered retention / cleanup
 # ---------------------------------------------------------------------------
 
+_BACKUP_ZIP_RE = re.compile(r"^(\d{4})-(\d{2})-(\d{2})_(daily|weekly|monthly)\.zip$")
+
+
 def _parse_backup_zip(name: str) -> tuple[date, str] | None:
     """
     Parse a backup filename like ``2026-02-20_daily.zip`` into
     ``(date(2026, 2, 20), "daily")``.  Returns None on mismatch.
+
+    One precompiled regex match extracts date parts and tier together,
+    replacing the per-tier endswith probes and fromisoformat call.
     """
-    if not name.endswith(".zip"):
+    m = _BACKUP_ZIP_RE.match(name)
+    if not m:
+        return None
+    try:
+        return (date(int(m[1]), int(m[2]), int(m[3])), m[4])
+    except ValueError:
         return None
-    stem = name[:-4]                       # strip .zip
-    for tier in TIERS:
-        suffix = f"_{tier}"
-        if stem.endswith(suffix):
-            date_str = stem[: -len(suffix)]
-            try:
-                d = date.fromisoformat(date_str)
-                return (d, tier)
-            except ValueError:
-                return None
-    return None
 
 
 def _iso_week(d: date) -> tuple[int, int]:
@@ -166,17 +624,20 @@ def cleanup_old_backups(backup_dir: Path) -> int:
          ``_monthly``; keep those indefinitely.
       5. Delete everything else.
     """
-    if not backup_dir.exists():
+    # Collect all backup zips: {path: (date, tier)}.  Plain string paths
+    # and scandir's cached entry data keep this free of per-file Path
+    # allocations and extra stat calls.
+    backups: dict[str, tuple[date, str]] = {}
+    try:
+        with os.scandir(backup_dir) as it:
+            for entry in it:
+                if entry.is_file():
+                    parsed = _parse_backup_zip(entry.name)
+                    if parsed:
+                        backups[entry.path] = parsed
+    except OSError:
         return 0
 
-    # Collect all backup zips: {Path: (date, tier)}
-    backups: dict[Path, tuple[date, str]] = {}
-    for entry in backup_dir.iterdir():
-        if entry.is_file():
-            parsed = _parse_backup_zip(entry.name)
-            if parsed:
-                backups[entry] = parsed
-
     if not backups:
         return 0
 
@@ -184,23 +645,31 @@ def cleanup_old_backups(backup_dir: Path) -> int:
     daily_cutoff = today - timedelta(days=7)
     weekly_cutoff = today - timedelta(weeks=4)
 
-    keep: set[Path] = set()
-
-    # --- Step 1: keep the 7 most recent dailies ---
-    dailies = sorted(
-        [(p, d) for p, (d, t) in backups.items() if t == "daily"],
-        key=lambda x: x[1], reverse=True,
-    )
-    for p, d in dailies[:7]:
-        keep.add(p)
+    keep: set[str] = set()
 
-    # --- Step 2: promote one per week (outside daily window, within 4 wks) ---
-    # Candidates: all backups in the date range (weekly_cutoff, daily_cutoff]
-    weekly_candidates: dict[tuple[int, int], list[tuple[Path, date, str]]] = defaultdict(list)
+    # Bin everything in a single pass: dailies (any age), pre-existing
+    # monthlies, and the weekly/monthly promotion windows by date range.
+    dailies: list[tuple[str, date]] = []
+    monthlies: list[str] = []
+    weekly_candidates: dict[tuple[int, int], list[tuple[str, date, str]]] = defaultdict(list)
+    monthly_candidates: dict[tuple[int, int], list[tuple[str, date, str]]] = defaultdict(list)
     for p, (d, t) in backups.items():
+        if t == "daily":
+            dailies.append((p, d))
+        elif t == "monthly":
+            monthlies.append(p)
         if weekly_cutoff < d <= daily_cutoff:
             weekly_candidates[_iso_week(d)].append((p, d, t))
+        elif d <= weekly_cutoff:
+            monthly_candidates[_year_month(d)].append((p, d, t))
+
+    # --- Step 1: keep the 7 most recent dailies ---
+    # nlargest is O(N log 7) against a full sort's O(N log N); backup
+    # dirs only grow over a tool's lifetime.
+    for p, d in heapq.nlargest(7, dailies, key=itemgetter(1)):
+        keep.add(p)
 
+    # --- Step 2: promote one per week (outside daily window, within 4 wks) ---
     for week_key, entries in weekly_candidates.items():
         # Prefer an existing weekly, otherwise pick the newest
         existing_weekly = [e for e in entries if e[2] == "weekly"]
@@ -210,9 +679,9 @@ def cleanup_old_backups(backup_dir: Path) -> int:
         else:
             winner = max(entries, key=lambda e: e[1])
             new_name = f"{winner[1].isoformat()}_weekly.zip"
-            new_path = backup_dir / new_name
+            new_path = os.path.join(backup_dir, new_name)
             try:
-                winner[0].rename(new_path)
+                os.rename(winner[0], new_path)
                 keep.add(new_path)
                 backups[new_path] = (winner[1], "weekly")
                 del backups[winner[0]]
@@ -220,12 +689,11 @@ def cleanup_old_backups(backup_dir: Path) -> int:
                 keep.add(winner[0])
 
     # --- Step 3: promote one per calendar month (older than 4 weeks) ---
-    monthly_candidates: dict[tuple[int, int], list[tuple[Path, date, str]]] = defaultdict(list)
-    for p, (d, t) in backups.items():
-        if d <= weekly_cutoff and p not in keep:
-            monthly_candidates[_year_month(d)].append((p, d, t))
-
-    for month_key, entries in monthly_candidates.items():
+    for month_key, candidates in monthly_candidates.items():
+        # Dailies that survived step 1 are not promotion candidates.
+        entries = [e for e in candidates if e[0] not in keep]
+        if not entries:
+            continue
         existing_monthly = [e for e in entries if e[2] == "monthly"]
         if existing_monthly:
             winner = max(existing_monthly, key=lambda e: e[1])
@@ -233,25 +701,23 @@ def cleanup_old_backups(backup_dir: Path) -> int:
         else:
             winner = max(entries, key=lambda e: e[1])
             new_name = f"{winner[1].isoformat()}_monthly.zip"
-            new_path = backup_dir / new_name
+            new_path = os.path.join(backup_dir, new_name)
             try:
-                winner[0].rename(new_path)
+                os.rename(winner[0], new_path)
                 keep.add(new_path)
             except Exception:
                 keep.add(winner[0])
 
     # Also keep any already-promoted monthlies that are still in range
-    for p, (d, t) in backups.items():
-        if t == "monthly":
-            keep.add(p)
+    keep.update(monthlies)
 
     # --- Step 4: delete everything not kept ---
     removed = 0
-    for p in list(backups.keys()):
-        if p not in keep and p.exists():
+    for p in backups:
+        if p not in keep:
             try:
-                p.unlink()
+                os.unlink(p)
                 removed += 1
-            except Exception:
+            except OSError:
                 pass
     return removed
@@ -15,6 +15,8 @@ can be edited via the Settings dialog in the tray menu.
 
 from __future__ import annotations
 
+import atexit
+import functools
 import os
 import sys
 import json
@@ -22,8 +24,9 @@ import time
 import threading
 import subprocess
 import ctypes
-import tkinter as tk
-from tkinter import ttk, filedialog
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, fields
+from operator import itemgetter
 from pathlib import Path
 from datetime import datetime, timezone
 
@@ -42,12 +45,10 @@ def _acquire_single_instance() -> bool:
     _mutex_handle = ctypes.windll.kernel32.CreateMutexW(None, True, _MUTEX_NAME)
     return ctypes.windll.kernel32.GetLastError() != 183  # ERROR_ALREADY_EXISTS
 
-try:
-    import pystray
-    from PIL import Image, ImageDraw, ImageFont
-except ImportError:
-    print("Missing dependencies. Install with:  pip install pystray pillow", file=sys.stderr)
-    sys.exit(1)
+# pystray / PIL / tkinter are imported lazily inside the functions that
+# use them so the --check CLI path doesn't pay the GUI-stack import cost
+# (a few hundred ms).  main() verifies they are installed before entering
+# tray mode.
 
 from profile_checker import (
     check_profile,
@@ -57,7 +58,6 @@ from profile_checker import (
 )
 from backup_service import (
     run_backup,
-    should_backup,
     cleanup_old_backups,
 )
 
@@ -65,41 +65,79 @@ from backup_service import (
 # Config file
 # ---------------------------------------------------------------------------
 
+# Computed once at import -- the environment doesn't change under us, and
+# callers hit these on every load/save/startup check.
+_APPDATA = Path(os.environ.get("APPDATA", os.path.expanduser("~")))
+_CONFIG_PATH = _APPDATA / "jEveAssetsCompanion" / "config.json"
+_STARTUP_PATH = (_APPDATA / "Microsoft" / "Windows" / "Start Menu"
+                 / "Programs" / "Startup" / "jEveAssetsCompanion.lnk")
+
 def _config_path() -> Path:
-    return Path(os.environ.get("APPDATA", os.path.expanduser("~"))) / "jEveAssetsCompanion" / "config.json"
-
-_DEFAULT_CONFIG = {
-    "warn_days": 14,
-    "check_interval": 3600,
-    "reminder_hours": 24,
-    "jeveassets_path": "",
-    "use_jmem": False,
-    "data_dir": "",
-    "backup_enabled": True,
-    "backup_dir": "",
-    "backup_interval_hours": 24,
-    "last_backup_time": "",
-}
-
-def load_config() -> dict:
+    return _CONFIG_PATH
+
+@dataclass(slots=True)
+class Config:
+    """
+    Runtime configuration.  Slots keep attribute access on the hot
+    check/tooltip paths cheap; "_"-prefixed fields are derived helpers
+    and are never serialized.
+    """
+    warn_days: int = 14
+    check_interval: int = 3600
+    reminder_hours: int = 24
+    jeveassets_path: str = ""
+    use_jmem: bool = False
+    data_dir: str = ""
+    backup_enabled: bool = True
+    backup_dir: str = ""
+    backup_interval_hours: int = 24
+    last_backup_time: str = ""
+    # last_backup_time parsed once at load; kept in sync on every backup.
+    _last_backup_dt: datetime | None = None
+
+_CONFIG_FIELDS = tuple(
+    f.name for f in fields(Config) if not f.name.startswith("_"))
+
+def _parse_iso_or_none(iso: str) -> datetime | None:
+    try:
+        return datetime.fromisoformat(iso)
+    except (ValueError, TypeError):
+        return None
+
+def load_config() -> Config:
     path = _config_path()
-    cfg = dict(_DEFAULT_CONFIG)
+    cfg = Config()
     if path.exists():
         try:
             with open(path, "r", encoding="utf-8") as f:
                 stored = json.load(f)
-            cfg.update({k: stored[k] for k in _DEFAULT_CONFIG if k in stored})
+            for name in _CONFIG_FIELDS:
+                if name in stored:
+                    setattr(cfg, name, stored[name])
         except Exception:
             pass
     else:
         save_config(cfg)
+    cfg._last_backup_dt = _parse_iso_or_none(cfg.last_backup_time)
     return cfg
 
-def save_config(cfg: dict):
+_last_written_cfg: dict | None = None
+
+def save_config(cfg: Config):
+    # Skip the write when nothing changed (frequent on the
+    # last_backup_time update path), and go through a temp file +
+    # os.replace so a crash can't leave a truncated config behind.
+    global _last_written_cfg
+    data = {k: v for k, v in asdict(cfg).items() if not k.startswith("_")}
+    if data == _last_written_cfg:
+        return
     path = _config_path()
     path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(cfg, f, indent=2)
+    tmp = path.with_suffix(".json.tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+    os.replace(tmp, path)
+    _last_written_cfg = data
 
 
 # ---------------------------------------------------------------------------
@@ -107,8 +145,7 @@ def save_config(cfg: dict):
 # ---------------------------------------------------------------------------
 
 def _startup_shortcut_path() -> Path:
-    startup = Path(os.environ.get("APPDATA", "")) / "Microsoft" / "Windows" / "Start Menu" / "Programs" / "Startup"
-    return startup / "jEveAssetsCompanion.lnk"
+    return _STARTUP_PATH
 
 def is_startup_enabled() -> bool:
     return _startup_shortcut_path().exists()
@@ -130,14 +167,7 @@ def set_startup_enabled(enabled: bool):
             f'$sc.Description = "{APP_NAME}"; '
             f'$sc.Save()'
         )
-        try:
-            subprocess.run(
-                ["powershell", "-ExecutionPolicy", "Bypass", "-Command", ps_script],
-                capture_output=True, timeout=10,
-                creationflags=subprocess.CREATE_NO_WINDOW,
-            )
-        except Exception:
-            pass
+        _run_powershell(ps_script)
     else:
         try:
             shortcut_path.unlink(missing_ok=True)
@@ -149,8 +179,16 @@ def set_startup_enabled(enabled: bool):
 # Icon helpers
 # ---------------------------------------------------------------------------
 
-def _create_icon_image(state: str = "ok") -> Image.Image:
-    """Generate a 64x64 tray icon: green="ok", red="warn", grey="error"."""
+@functools.lru_cache(maxsize=4)
+def _create_icon_image(state: str = "ok"):
+    """
+    Generate a 64x64 tray icon: green="ok", red="warn", grey="error".
+
+    Cached per state -- the image is a pure function of *state* and the
+    font load is the expensive part, so each variant is drawn once.
+    """
+    from PIL import Image, ImageDraw, ImageFont
+
     colours = {
         "ok":    ((34, 139, 34),  (255, 255, 255)),
         "warn":  ((200, 60, 30),  (255, 255, 255)),
@@ -171,37 +209,105 @@ def _create_icon_image(state: str = "ok") -> Image.Image:
 
 
 # ---------------------------------------------------------------------------
-# Windows toast notification
+# Persistent PowerShell host
 # ---------------------------------------------------------------------------
 
-def show_notification(title: str, message: str):
-    message_escaped = message.replace('"', '`"').replace("$", '`$').replace("\n", " ")
-    title_escaped = title.replace('"', '`"').replace("$", '`$')
-
-    ps_script = f'''
-[Windows.UI.Notifications.ToastNotificationManager, Windows.UI.Notifications, ContentType = WindowsRuntime] | Out-Null
-[Windows.Data.Xml.Dom.XmlDocument, Windows.Data.Xml.Dom.XmlDocument, ContentType = WindowsRuntime] | Out-Null
+class _PwshHost:
+    """
+    A single long-lived ``powershell -Command -`` child process.
+
+    Spawning powershell.exe costs around a second of engine init per
+    call; keeping one host alive and feeding scripts through its stdin
+    amortizes that across every toast and shortcut operation.  Scripts
+    are terminated by a sentinel echoed to stdout so run() knows when
+    the host is idle again.
+    """
+
+    _instance: _PwshHost | None = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._proc: subprocess.Popen | None = None
+
+    @classmethod
+    def instance(cls) -> _PwshHost:
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+                atexit.register(cls._instance.close)
+            return cls._instance
+
+    def _ensure_proc(self) -> subprocess.Popen:
+        if self._proc is None or self._proc.poll() is not None:
+            self._proc = subprocess.Popen(
+                ["powershell", "-NoProfile", "-NonInteractive",
+                 "-ExecutionPolicy", "Bypass", "-Command", "-"],
+                stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True, encoding="utf-8",
+                creationflags=subprocess.CREATE_NO_WINDOW,
+            )
+        return self._proc
 
-$xml = [Windows.Data.Xml.Dom.XmlDocument]::new()
-$xml.LoadXml(@"
-<toast>
-    <visual>
-        <binding template="ToastText02">
-            <text id="1">{title_escaped}</text>
-            <text id="2">{message_escaped}</text>
-        </binding>
-    </visual>
-</toast>
-"@)
+    def run(self, ps_script: str) -> bool:
+        """Run *ps_script* on the host; False means the host is unusable."""
+        with self._lock:
+            try:
+                proc = self._ensure_proc()
+                # Watchdog: if the host wedges and stops echoing, kill it
+                # so the readline loop ends and the caller falls back to a
+                # one-shot powershell instead of holding the lock forever.
+                # Same 10s bound the one-shot runs use.
+                watchdog = threading.Timer(10, proc.kill)
+                watchdog.daemon = True
+                watchdog.start()
+                try:
+                    proc.stdin.write(ps_script + "\nWrite-Output '__DONE__'\n")
+                    proc.stdin.flush()
+                    while True:
+                        line = proc.stdout.readline()
+                        if not line:
+                            raise OSError("powershell host exited")
+                        if line.strip() == "__DONE__":
+                            return True
+                finally:
+                    watchdog.cancel()
+            except Exception:
+                proc, self._proc = self._proc, None
+                if proc is not None:
+                    try:
+                        proc.kill()
+                    except Exception:
+                        pass
+                return False
 
-$toast = [Windows.UI.Notifications.ToastNotification]::new($xml)
-[Windows.UI.Notifications.ToastNotificationManager]::CreateToastNotifier("{APP_NAME}").Show($toast)
-'''
+    def close(self):
+        with self._lock:
+            proc, self._proc = self._proc, None
+            if proc is not None:
+                try:
+                    proc.stdin.write("exit\n")
+                    proc.stdin.flush()
+                    proc.wait(timeout=2)
+                except Exception:
+                    try:
+                        proc.kill()
+                    except Exception:
+                        pass
+
+
+def _run_powershell(ps_script: str):
+    """Run a script on the persistent host, one-shot powershell fallback."""
+    if _PwshHost.instance().run(ps_script):
+        return
     try:
+        # -NoProfile skips $PROFILE/PSReadLine loading, which dominates
+        # powershell.exe startup time; neither script needs profile state.
         subprocess.run(
-            ["powershell", "-ExecutionPolicy", "Bypass", "-Command", ps_script],
-            capture_output=True,
-            timeout=10,
+            ["powershell", "-NoProfile", "-NonInteractive",
+             "-ExecutionPolicy", "Bypass", "-Command", ps_script],
+            capture_output=True, timeout=10,
             creationflags=subprocess.CREATE_NO_WINDOW,
         )
     except Exception:
@@ -209,215 +315,377 @@ $toast = [Windows.UI.Notifications.ToastNotification]::new($xml)
 
 
 # ---------------------------------------------------------------------------
-# Settings dialog  (tkinter)
+# Windows toast notification
 # ---------------------------------------------------------------------------
 
-def show_settings_dialog(cfg: dict, on_save=None):
-    root = tk.Tk()
-    root.title(f"{APP_NAME} - Settings")
-    root.resizable(False, False)
-    root.attributes("-topmost", True)
-
-    frame = ttk.Frame(root, padding=16)
-    frame.grid(sticky="nsew")
-
-    row = 0
-
-    ttk.Label(frame, text="Alert threshold (days):").grid(row=row, column=0, sticky="w", pady=(0, 6))
-    var_days = tk.IntVar(value=cfg["warn_days"])
-    ttk.Spinbox(frame, from_=1, to=365, textvariable=var_days, width=8).grid(row=row, column=1, sticky="w", pady=(0, 6))
-    row += 1
-
-    ttk.Label(frame, text="Check interval (minutes):").grid(row=row, column=0, sticky="w", pady=(0, 6))
-    var_interval = tk.IntVar(value=cfg["check_interval"] // 60)
-    ttk.Spinbox(frame, from_=1, to=1440, textvariable=var_interval, width=8).grid(row=row, column=1, sticky="w", pady=(0, 6))
-    row += 1
-
-    ttk.Label(frame, text="Reminder interval (hours):").grid(row=row, column=0, sticky="w", pady=(0, 6))
-    var_reminder = tk.IntVar(value=cfg.get("reminder_hours", 24))
-    ttk.Spinbox(frame, from_=1, to=168, textvariable=var_reminder, width=8).grid(row=row, column=1, sticky="w", pady=(0, 6))
-    row += 1
+# None = not probed yet; False = winsdk unavailable, use PowerShell.
+_winrt_toasts: bool | None = None
 
-    ttk.Separator(frame, orient="horizontal").grid(row=row, column=0, columnspan=3, sticky="ew", pady=8)
-    row += 1
 
-    ttk.Label(frame, text="jEveAssets folder:").grid(row=row, column=0, sticky="w", pady=(0, 6))
-    var_path = tk.StringVar(value=cfg["jeveassets_path"])
-    ttk.Entry(frame, textvariable=var_path, width=36).grid(row=row, column=1, sticky="w", pady=(0, 6))
-
-    def browse_folder():
-        initial = var_path.get().strip()
-        if initial and Path(initial).is_dir():
-            start = initial
-        else:
-            start = str(Path.home())
-        d = filedialog.askdirectory(title="Select jEveAssets installation folder", initialdir=start)
-        if d:
-            var_path.set(d)
-
-    ttk.Button(frame, text="...", width=3, command=browse_folder).grid(row=row, column=2, padx=(4, 0), pady=(0, 6))
-    row += 1
-
-    var_jmem = tk.BooleanVar(value=cfg["use_jmem"])
-    ttk.Checkbutton(frame, text="Use jmemory.jar instead of jeveassets.jar", variable=var_jmem).grid(
-        row=row, column=0, columnspan=3, sticky="w", pady=(0, 6)
+def _show_toast_winrt(title: str, message: str) -> bool:
+    """
+    Show a toast through the WinRT API in-process via the optional
+    ``winsdk`` package.  Returns False when winsdk is not installed so
+    the caller can fall back to the PowerShell path; this skips the
+    powershell.exe spawn entirely, the biggest latency in a toast.
+    """
+    global _winrt_toasts
+    if _winrt_toasts is False:
+        return False
+    try:
+        from winsdk.windows.ui.notifications import (
+            ToastNotificationManager, ToastNotification,
+        )
+        from winsdk.windows.data.xml.dom import XmlDocument
+    except ImportError:
+        _winrt_toasts = False
+        return False
+    _winrt_toasts = True
+    from xml.sax.saxutils import escape
+    xml = XmlDocument()
+    xml.load_xml(
+        "<toast><visual><binding template='ToastText02'>"
+        f"<text id='1'>{escape(title)}</text>"
+        f"<text id='2'>{escape(message)}</text>"
+        "</binding></visual></toast>"
     )
-    row += 1
+    ToastNotificationManager.create_toast_notifier(APP_NAME).show(
+        ToastNotification(xml))
+    return True
 
-    ttk.Separator(frame, orient="horizontal").grid(row=row, column=0, columnspan=3, sticky="ew", pady=8)
-    row += 1
 
-    ttk.Label(frame, text="Data directory (blank = auto):").grid(row=row, column=0, sticky="w", pady=(0, 6))
-    var_datadir = tk.StringVar(value=cfg.get("data_dir", ""))
-    ttk.Entry(frame, textvariable=var_datadir, width=36).grid(row=row, column=1, sticky="w", pady=(0, 6))
-
-    def browse_data():
-        initial = var_datadir.get().strip()
-        if initial and Path(initial).is_dir():
-            start = initial
-        else:
-            start = str(_default_profile_dir())
-        d = filedialog.askdirectory(title="Select jEveAssets data directory (.jeveassets)", initialdir=start)
-        if d:
-            var_datadir.set(d)
+# Built once; show_notification only substitutes the two escaped strings.
+# str.format is used rather than string.Template because the script is
+# full of PowerShell's own $ identifiers.
+_TOAST_PS_TEMPLATE = '''
+[Windows.UI.Notifications.ToastNotificationManager, Windows.UI.Notifications, ContentType = WindowsRuntime] | Out-Null
+[Windows.Data.Xml.Dom.XmlDocument, Windows.Data.Xml.Dom.XmlDocument, ContentType = WindowsRuntime] | Out-Null
 
-    ttk.Button(frame, text="...", width=3, command=browse_data).grid(row=row, column=2, padx=(4, 0), pady=(0, 6))
-    row += 1
+$xml = [Windows.Data.Xml.Dom.XmlDocument]::new()
+$xml.LoadXml(@"
+<toast>
+    <visual>
+        <binding template="ToastText02">
+            <text id="1">{title}</text>
+            <text id="2">{body}</text>
+        </binding>
+    </visual>
+</toast>
+"@)
 
-    ttk.Separator(frame, orient="horizontal").grid(row=row, column=0, columnspan=3, sticky="ew", pady=8)
-    row += 1
+$toast = [Windows.UI.Notifications.ToastNotification]::new($xml)
+[Windows.UI.Notifications.ToastNotificationManager]::CreateToastNotifier("{app}").Show($toast)
+'''
 
-    # -- Backup section --
-    ttk.Label(frame, text="Backup", font=("Segoe UI", 9, "bold")).grid(row=row, column=0, sticky="w", pady=(0, 4))
-    row += 1
 
-    var_backup_enabled = tk.BooleanVar(value=cfg.get("backup_enabled", True))
-    ttk.Checkbutton(frame, text="Enable automatic backups", variable=var_backup_enabled).grid(
-        row=row, column=0, columnspan=3, sticky="w", pady=(0, 6)
+def show_notification(title: str, message: str):
+    try:
+        if _show_toast_winrt(title, message):
+            return
+    except Exception:
+        pass
+    ps_script = _TOAST_PS_TEMPLATE.format(
+        title=title.replace('"', '`"').replace("$", '`$'),
+        body=message.replace('"', '`"').replace("$", '`$').replace("\n", " "),
+        app=APP_NAME,
     )
-    row += 1
+    _run_powershell(ps_script)
 
-    ttk.Label(frame, text="Backup directory:").grid(row=row, column=0, sticky="w", pady=(0, 6))
-    var_backup_dir = tk.StringVar(value=cfg.get("backup_dir", ""))
-    ttk.Entry(frame, textvariable=var_backup_dir, width=36).grid(row=row, column=1, sticky="w", pady=(0, 6))
 
-    def browse_backup():
-        initial = var_backup_dir.get().strip()
-        if initial and Path(initial).is_dir():
-            start = initial
-        else:
-            start = str(Path.home())
-        d = filedialog.askdirectory(title="Select backup directory", initialdir=start)
-        if d:
-            var_backup_dir.set(d)
-
-    ttk.Button(frame, text="...", width=3, command=browse_backup).grid(row=row, column=2, padx=(4, 0), pady=(0, 6))
-    row += 1
+# ---------------------------------------------------------------------------
+# Settings dialog  (tkinter)
+# ---------------------------------------------------------------------------
 
-    last_backup = cfg.get("last_backup_time", "")
-    if last_backup:
-        try:
-            dt = datetime.fromisoformat(last_backup)
-            last_backup_display = dt.strftime("%Y-%m-%d %H:%M:%S")
-        except (ValueError, TypeError):
-            last_backup_display = last_backup
-    else:
-        last_backup_display = "Never"
-    lbl_last_backup = ttk.Label(frame, text=f"Last backup: {last_backup_display}")
-    lbl_last_backup.grid(row=row, column=0, columnspan=2, sticky="w", pady=(0, 6))
-
-    def _backup_worker(data_dir, bdir):
-        result = run_backup(data_dir, Path(bdir))
-        if result["error"]:
-            ctypes.windll.user32.MessageBoxW(0, f"Backup failed:\n{result['error']}", "Backup Error", 0x10)
+class SettingsDialog:
+    """
+    The settings window, built once and reused.
+
+    Creating a tk.Tk() root costs several hundred ms per open; instead
+    of destroying the window on Save/Cancel it is withdrawn, and show()
+    repopulates the tk.Variables from cfg and deiconifies.  All Tk work
+    runs on one dedicated thread because Tcl interpreters must stay on
+    the thread that created them.
+    """
+
+    _instance: SettingsDialog | None = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self):
+        self._thread = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="companion-settings")
+        self._root = None
+        self._backup_fn = None
+
+    @classmethod
+    def instance(cls) -> SettingsDialog:
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+
+    def show(self, cfg: Config, on_save=None, backup_fn=None) -> bool:
+        """Open the dialog and block until it closes.  Returns True on Save."""
+        return self._thread.submit(self._show, cfg, on_save, backup_fn).result()
+
+    # -- everything below runs on the dialog thread -------------------------
+
+    def _show(self, cfg, on_save, backup_fn):
+        if self._root is not None:
+            try:
+                self._root.winfo_exists()
+            except Exception:
+                self._root = None
+        if self._root is None:
+            self._build()
+        self._cfg = cfg
+        self._backup_fn = backup_fn
+        self._saved = False
+        self._populate(cfg)
+        self._root.deiconify()
+        self._root.attributes("-topmost", True)
+        self._root.mainloop()
+        if self._saved and on_save:
+            on_save(cfg)
+        return self._saved
+
+    def _populate(self, cfg):
+        self.var_days.set(cfg.warn_days)
+        self.var_interval.set(cfg.check_interval // 60)
+        self.var_reminder.set(cfg.reminder_hours)
+        self.var_path.set(cfg.jeveassets_path)
+        self.var_jmem.set(cfg.use_jmem)
+        self.var_datadir.set(cfg.data_dir)
+        self.var_backup_enabled.set(cfg.backup_enabled)
+        self.var_backup_dir.set(cfg.backup_dir)
+        self.var_startup.set(is_startup_enabled())
+        if cfg._last_backup_dt is not None:
+            last_backup_display = cfg._last_backup_dt.strftime("%Y-%m-%d %H:%M:%S")
+        elif cfg.last_backup_time:
+            last_backup_display = cfg.last_backup_time
         else:
-            cleanup_old_backups(Path(bdir))
-            now_iso = datetime.now(timezone.utc).isoformat()
-            cfg["last_backup_time"] = now_iso
+            last_backup_display = "Never"
+        self.lbl_last_backup.config(text=f"Last backup: {last_backup_display}")
+        self.btn_backup.config(state="normal")
+
+    def _close(self):
+        self._root.withdraw()
+        self._root.quit()
+
+    def _build(self):
+        import tkinter as tk
+        from tkinter import ttk, filedialog
+
+        root = self._root = tk.Tk()
+        root.withdraw()
+        root.title(f"{APP_NAME} - Settings")
+        root.resizable(False, False)
+        # Closing via the title bar cancels; never destroy the warm root.
+        root.protocol("WM_DELETE_WINDOW", self._close)
+
+        frame = ttk.Frame(root, padding=16)
+        frame.grid(sticky="nsew")
+
+        row = 0
+
+        ttk.Label(frame, text="Alert threshold (days):").grid(row=row, column=0, sticky="w", pady=(0, 6))
+        self.var_days = tk.IntVar()
+        ttk.Spinbox(frame, from_=1, to=365, textvariable=self.var_days, width=8).grid(row=row, column=1, sticky="w", pady=(0, 6))
+        row += 1
+
+        ttk.Label(frame, text="Check interval (minutes):").grid(row=row, column=0, sticky="w", pady=(0, 6))
+        self.var_interval = tk.IntVar()
+        ttk.Spinbox(frame, from_=1, to=1440, textvariable=self.var_interval, width=8).grid(row=row, column=1, sticky="w", pady=(0, 6))
+        row += 1
+
+        ttk.Label(frame, text="Reminder interval (hours):").grid(row=row, column=0, sticky="w", pady=(0, 6))
+        self.var_reminder = tk.IntVar()
+        ttk.Spinbox(frame, from_=1, to=168, textvariable=self.var_reminder, width=8).grid(row=row, column=1, sticky="w", pady=(0, 6))
+        row += 1
+
+        ttk.Separator(frame, orient="horizontal").grid(row=row, column=0, columnspan=3, sticky="ew", pady=8)
+        row += 1
+
+        ttk.Label(frame, text="jEveAssets folder:").grid(row=row, column=0, sticky="w", pady=(0, 6))
+        self.var_path = tk.StringVar()
+        ttk.Entry(frame, textvariable=self.var_path, width=36).grid(row=row, column=1, sticky="w", pady=(0, 6))
+
+        def browse_folder():
+            initial = self.var_path.get().strip()
+            if initial and Path(initial).is_dir():
+                start = initial
+            else:
+                start = str(Path.home())
+            d = filedialog.askdirectory(title="Select jEveAssets installation folder", initialdir=start)
+            if d:
+                self.var_path.set(d)
+
+        ttk.Button(frame, text="...", width=3, command=browse_folder).grid(row=row, column=2, padx=(4, 0), pady=(0, 6))
+        row += 1
+
+        self.var_jmem = tk.BooleanVar()
+        ttk.Checkbutton(frame, text="Use jmemory.jar instead of jeveassets.jar", variable=self.var_jmem).grid(
+            row=row, column=0, columnspan=3, sticky="w", pady=(0, 6)
+        )
+        row += 1
+
+        ttk.Separator(frame, orient="horizontal").grid(row=row, column=0, columnspan=3, sticky="ew", pady=8)
+        row += 1
+
+        ttk.Label(frame, text="Data directory (blank = auto):").grid(row=row, column=0, sticky="w", pady=(0, 6))
+        self.var_datadir = tk.StringVar()
+        ttk.Entry(frame, textvariable=self.var_datadir, width=36).grid(row=row, column=1, sticky="w", pady=(0, 6))
+
+        def browse_data():
+            initial = self.var_datadir.get().strip()
+            if initial and Path(initial).is_dir():
+                start = initial
+            else:
+                start = str(_default_profile_dir())
+            d = filedialog.askdirectory(title="Select jEveAssets data directory (.jeveassets)", initialdir=start)
+            if d:
+                self.var_datadir.set(d)
+
+        ttk.Button(frame, text="...", width=3, command=browse_data).grid(row=row, column=2, padx=(4, 0), pady=(0, 6))
+        row += 1
+
+        ttk.Separator(frame, orient="horizontal").grid(row=row, column=0, columnspan=3, sticky="ew", pady=8)
+        row += 1
+
+        # -- Backup section --
+        ttk.Label(frame, text="Backup", font=("Segoe UI", 9, "bold")).grid(row=row, column=0, sticky="w", pady=(0, 4))
+        row += 1
+
+        self.var_backup_enabled = tk.BooleanVar()
+        ttk.Checkbutton(frame, text="Enable automatic backups", variable=self.var_backup_enabled).grid(
+            row=row, column=0, columnspan=3, sticky="w", pady=(0, 6)
+        )
+        row += 1
+
+        ttk.Label(frame, text="Backup directory:").grid(row=row, column=0, sticky="w", pady=(0, 6))
+        self.var_backup_dir = tk.StringVar()
+        ttk.Entry(frame, textvariable=self.var_backup_dir, width=36).grid(row=row, column=1, sticky="w", pady=(0, 6))
+
+        def browse_backup():
+            initial = self.var_backup_dir.get().strip()
+            if initial and Path(initial).is_dir():
+                start = initial
+            else:
+                start = str(Path.home())
+            d = filedialog.askdirectory(title="Select backup directory", initialdir=start)
+            if d:
+                self.var_backup_dir.set(d)
+
+        ttk.Button(frame, text="...", width=3, command=browse_backup).grid(row=row, column=2, padx=(4, 0), pady=(0, 6))
+        row += 1
+
+        self.lbl_last_backup = ttk.Label(frame, text="Last backup: Never")
+        self.lbl_last_backup.grid(row=row, column=0, columnspan=2, sticky="w", pady=(0, 6))
+
+        def _backup_worker(data_dir, bdir):
+            cfg = self._cfg
+            # Tray mode: run through the app's _do_backup so the backup
+            # lock still applies and a manual backup pushes the next
+            # scheduled one out - even if the dialog is then closed with
+            # Cancel.  Results arrive as toasts rather than dialogs.
+            backup_fn = self._backup_fn
+            if backup_fn is not None:
+                if backup_fn():
+                    root.after(0, lambda: self.lbl_last_backup.config(
+                        text=f"Last backup: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"))
+                root.after(0, lambda: self.btn_backup.config(state="normal"))
+                return
+            # Standalone (first-run setup, no scheduler): back up
+            # directly and report with message boxes.
+            result = run_backup(data_dir, Path(bdir))
+            if result["error"]:
+                ctypes.windll.user32.MessageBoxW(0, f"Backup failed:\n{result['error']}", "Backup Error", 0x10)
+            else:
+                cleanup_old_backups(Path(bdir))
+                now_dt = datetime.now(timezone.utc)
+                cfg.last_backup_time = now_dt.isoformat()
+                cfg._last_backup_dt = now_dt
+                save_config(cfg)
+                root.after(0, lambda: self.lbl_last_backup.config(
+                    text=f"Last backup: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"))
+                size_mb = result["total_bytes"] / (1024 * 1024)
+                ctypes.windll.user32.MessageBoxW(
+                    0,
+                    f"Backup complete!\n\n"
+                    f"Files: {result['file_count']}\n"
+                    f"Size: {size_mb:.1f} MB\n"
+                    f"Location: {result['dest']}",
+                    "Backup",
+                    0x40,
+                )
+            root.after(0, lambda: self.btn_backup.config(state="normal"))
+
+        def do_backup_now():
+            data_dir_str = self.var_datadir.get().strip()
+            data_dir = Path(data_dir_str) if data_dir_str else _default_profile_dir()
+            bdir = self.var_backup_dir.get().strip()
+            if not bdir:
+                ctypes.windll.user32.MessageBoxW(0, "Please set a backup directory first.", "Backup", 0x30)
+                return
+            self._cfg.backup_dir = bdir
+            self.btn_backup.config(state="disabled")
+            threading.Thread(target=_backup_worker, args=(data_dir, bdir), daemon=True).start()
+
+        self.btn_backup = ttk.Button(frame, text="Backup Now", command=do_backup_now)
+        self.btn_backup.grid(row=row, column=2, padx=(4, 0), pady=(0, 6))
+        row += 1
+
+        ttk.Separator(frame, orient="horizontal").grid(row=row, column=0, columnspan=3, sticky="ew", pady=8)
+        row += 1
+
+        self.var_startup = tk.BooleanVar()
+        ttk.Checkbutton(frame, text="Run at Windows startup", variable=self.var_startup).grid(
+            row=row, column=0, columnspan=3, sticky="w", pady=(0, 6)
+        )
+        row += 1
+
+        def do_save():
+            cfg = self._cfg
+            cfg.warn_days = max(1, self.var_days.get())
+            cfg.check_interval = max(60, self.var_interval.get() * 60)
+            cfg.reminder_hours = max(1, self.var_reminder.get())
+            cfg.jeveassets_path = self.var_path.get().strip()
+            cfg.use_jmem = self.var_jmem.get()
+            cfg.data_dir = self.var_datadir.get().strip()
+            cfg.backup_enabled = self.var_backup_enabled.get()
+            cfg.backup_dir = self.var_backup_dir.get().strip()
             save_config(cfg)
-            root.after(0, lambda: lbl_last_backup.config(
-                text=f"Last backup: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"))
-            size_mb = result["total_bytes"] / (1024 * 1024)
-            ctypes.windll.user32.MessageBoxW(
-                0,
-                f"Backup complete!\n\n"
-                f"Files: {result['file_count']}\n"
-                f"Size: {size_mb:.1f} MB\n"
-                f"Location: {result['dest']}",
-                "Backup",
-                0x40,
-            )
-        root.after(0, lambda: btn_backup.config(state="normal"))
-
-    def do_backup_now():
-        data_dir_str = var_datadir.get().strip()
-        data_dir = Path(data_dir_str) if data_dir_str else _default_profile_dir()
-        bdir = var_backup_dir.get().strip()
-        if not bdir:
-            ctypes.windll.user32.MessageBoxW(0, "Please set a backup directory first.", "Backup", 0x30)
-            return
-        cfg["backup_dir"] = bdir
-        btn_backup.config(state="disabled")
-        threading.Thread(target=_backup_worker, args=(data_dir, bdir), daemon=True).start()
-
-    btn_backup = ttk.Button(frame, text="Backup Now", command=do_backup_now)
-    btn_backup.grid(row=row, column=2, padx=(4, 0), pady=(0, 6))
-    row += 1
+            set_startup_enabled(self.var_startup.get())
+            self._saved = True
+            self._close()
 
-    ttk.Separator(frame, orient="horizontal").grid(row=row, column=0, columnspan=3, sticky="ew", pady=8)
-    row += 1
+        def open_config_folder():
+            config_file = _config_path()
+            config_file.parent.mkdir(parents=True, exist_ok=True)
+            if config_file.exists():
+                subprocess.Popen(["explorer", "/select,", str(config_file)])
+            else:
+                subprocess.Popen(["explorer", str(config_file.parent)])
 
-    var_startup = tk.BooleanVar(value=is_startup_enabled())
-    ttk.Checkbutton(frame, text="Run at Windows startup", variable=var_startup).grid(
-        row=row, column=0, columnspan=3, sticky="w", pady=(0, 6)
-    )
-    row += 1
-
-    saved = [False]
-
-    def do_save():
-        cfg["warn_days"] = max(1, var_days.get())
-        cfg["check_interval"] = max(60, var_interval.get() * 60)
-        cfg["reminder_hours"] = max(1, var_reminder.get())
-        cfg["jeveassets_path"] = var_path.get().strip()
-        cfg["use_jmem"] = var_jmem.get()
-        cfg["data_dir"] = var_datadir.get().strip()
-        cfg["backup_enabled"] = var_backup_enabled.get()
-        cfg["backup_dir"] = var_backup_dir.get().strip()
-        save_config(cfg)
-        set_startup_enabled(var_startup.get())
-        saved[0] = True
-        root.destroy()
-
-    def do_cancel():
-        root.destroy()
-
-    def open_config_folder():
-        config_file = _config_path()
-        config_file.parent.mkdir(parents=True, exist_ok=True)
-        if config_file.exists():
-            subprocess.Popen(["explorer", "/select,", str(config_file)])
-        else:
-            subprocess.Popen(["explorer", str(config_file.parent)])
+        btn_frame = ttk.Frame(frame)
+        btn_frame.grid(row=row, column=0, columnspan=3, pady=(8, 0))
+        ttk.Button(btn_frame, text="Save", command=do_save).pack(side="left", padx=(0, 8))
+        ttk.Button(btn_frame, text="Cancel", command=self._close).pack(side="left")
+        ttk.Button(btn_frame, text="Open Config Folder", command=open_config_folder).pack(side="left", padx=(8, 0))
 
-    btn_frame = ttk.Frame(frame)
-    btn_frame.grid(row=row, column=0, columnspan=3, pady=(8, 0))
-    ttk.Button(btn_frame, text="Save", command=do_save).pack(side="left", padx=(0, 8))
-    ttk.Button(btn_frame, text="Cancel", command=do_cancel).pack(side="left")
-    ttk.Button(btn_frame, text="Open Config Folder", command=open_config_folder).pack(side="left", padx=(8, 0))
 
-    root.mainloop()
-    if saved[0] and on_save:
-        on_save(cfg)
-    return saved[0]
+def show_settings_dialog(cfg: Config, on_save=None, backup_fn=None):
+    return SettingsDialog.instance().show(cfg, on_save, backup_fn)
 
 
 # ---------------------------------------------------------------------------
 # Status window  (tkinter)
 # ---------------------------------------------------------------------------
 
-def show_status_window(profile_path: Path, warn_days: int, cfg: dict = None,
+def show_status_window(profile_path: Path, warn_days: int, cfg: Config = None,
                        on_launch=None, on_settings=None):
+    import tkinter as tk
+    from tkinter import ttk
+
     try:
         owners = check_profile(profile_path, warn_days, debug=False)
     except Exception as e:
@@ -425,6 +693,9 @@ def show_status_window(profile_path: Path, warn_days: int, cfg: dict = None,
         return
 
     root = tk.Tk()
+    # Keep the window hidden while widgets are built and rows inserted so
+    # Tk does a single geometry/redraw pass instead of one per insert.
+    root.withdraw()
     root.title(APP_NAME)
     root.resizable(True, True)
     root.attributes("-topmost", True)
@@ -439,10 +710,11 @@ def show_status_window(profile_path: Path, warn_days: int, cfg: dict = None,
     if not owners:
         ttk.Label(frame, text="No ESI owners found in profile.").grid(sticky="w")
         ttk.Button(frame, text="Close", command=root.destroy).grid(pady=(12, 0))
+        root.deiconify()
         root.mainloop()
         return
 
-    owners.sort(key=lambda x: x[2], reverse=True)
+    owners.sort(key=itemgetter(2), reverse=True)
     stale = [o for o in owners if o[2] >= warn_days]
 
     if stale:
@@ -461,9 +733,11 @@ def show_status_window(profile_path: Path, warn_days: int, cfg: dict = None,
     tree.column("character", width=180)
     tree.column("last_update", width=150, anchor="center")
 
-    for name, _ms, days_ago in owners:
-        status = "!!" if days_ago >= warn_days else "OK"
-        tree.insert("", "end", values=(status, name, f"{days_ago:.0f}"))
+    rows = [("!!" if days_ago >= warn_days else "OK", name, f"{days_ago:.0f}")
+            for name, _ms, days_ago in owners]
+    insert = tree.insert
+    for row in rows:
+        insert("", "end", values=row)
 
     tree.grid(row=1, column=0, sticky="nsew", pady=(0, 8))
     frame.rowconfigure(1, weight=1)
@@ -479,7 +753,7 @@ def show_status_window(profile_path: Path, warn_days: int, cfg: dict = None,
     btn_frame.grid(row=3, column=0, columnspan=2, pady=(8, 0), sticky="ew")
 
     if on_launch is not None:
-        jar_label = "jmemory.jar" if cfg and cfg.get("use_jmem") else "jeveassets.jar"
+        jar_label = "jmemory.jar" if cfg is not None and cfg.use_jmem else "jeveassets.jar"
         ttk.Button(btn_frame, text=f"Launch jEveAssets ({jar_label})", command=on_launch).pack(side="left", padx=(0, 8))
 
     if on_settings is not None:
@@ -487,6 +761,7 @@ def show_status_window(profile_path: Path, warn_days: int, cfg: dict = None,
 
     ttk.Button(btn_frame, text="Close", command=root.destroy).pack(side="right")
 
+    root.deiconify()
     root.mainloop()
 
 
@@ -494,30 +769,50 @@ def show_status_window(profile_path: Path, warn_days: int, cfg: dict = None,
 # Launch jEveAssets
 # ---------------------------------------------------------------------------
 
-def _find_jeveassets_jar(cfg: dict) -> Path | None:
-    jar_name = "jmemory.jar" if cfg.get("use_jmem") else "jeveassets.jar"
-    jeveassets_dir = cfg.get("jeveassets_path", "").strip()
+# Found JARs are cached indefinitely (they rarely move); misses are
+# re-probed after a short TTL so a fresh install gets picked up.
+_JAR_MISS_TTL = 60.0
+_jar_cache: dict[tuple[str, bool], tuple[str | None, float]] = {}
+
+
+def _find_jar_cached(jeveassets_dir: str, use_jmem: bool) -> str | None:
+    cached = _jar_cache.get((jeveassets_dir, use_jmem))
+    if cached is not None:
+        found, checked = cached
+        if found is not None or time.monotonic() - checked < _JAR_MISS_TTL:
+            return found
+
+    jar_name = "jmemory.jar" if use_jmem else "jeveassets.jar"
+    found = None
     if jeveassets_dir:
         candidate = Path(jeveassets_dir) / jar_name
         if candidate.exists():
-            return candidate
-    common_locations = [
-        Path(os.environ.get("PROGRAMFILES", "C:\\Program Files")) / "jEveAssets",
-        Path(os.environ.get("LOCALAPPDATA", "")) / "jEveAssets",
-        Path.home() / "Desktop" / "jEveAssets",
-        Path.home() / "jEveAssets",
-    ]
-    for loc in common_locations:
-        candidate = loc / jar_name
-        if candidate.exists():
-            return candidate
-    return None
-
-
-def open_jeveassets(cfg: dict):
+            found = str(candidate)
+    if found is None:
+        common_locations = [
+            Path(os.environ.get("PROGRAMFILES", "C:\\Program Files")) / "jEveAssets",
+            Path(os.environ.get("LOCALAPPDATA", "")) / "jEveAssets",
+            Path.home() / "Desktop" / "jEveAssets",
+            Path.home() / "jEveAssets",
+        ]
+        for loc in common_locations:
+            candidate = loc / jar_name
+            if candidate.exists():
+                found = str(candidate)
+                break
+    _jar_cache[(jeveassets_dir, use_jmem)] = (found, time.monotonic())
+    return found
+
+
+def _find_jeveassets_jar(cfg: Config) -> Path | None:
+    found = _find_jar_cached(cfg.jeveassets_path.strip(), cfg.use_jmem)
+    return Path(found) if found else None
+
+
+def open_jeveassets(cfg: Config):
     jar = _find_jeveassets_jar(cfg)
     if jar is None:
-        jar_name = "jmemory.jar" if cfg.get("use_jmem") else "jeveassets.jar"
+        jar_name = "jmemory.jar" if cfg.use_jmem else "jeveassets.jar"
         ctypes.windll.user32.MessageBoxW(
             0,
             f"Could not find {jar_name}.\n\n"
@@ -540,43 +835,80 @@ class CompanionApp:
     def __init__(
         self,
         profile_path: Path,
-        cfg: dict,
+        cfg: Config,
         log_file: Path | None = None,
     ):
         self.profile_path = profile_path
         self.cfg = cfg
-        self.warn_days = cfg["warn_days"]
-        self.check_interval = cfg["check_interval"]
+        self.warn_days = cfg.warn_days
+        self.check_interval = cfg.check_interval
         self.log_file = log_file
+        # One line-buffered handle for the lifetime of the app instead of
+        # an open/write/close cycle per log line.
+        self._log_fh = None
+        self._log_lock = threading.Lock()
+        if log_file:
+            try:
+                self._log_fh = open(log_file, "a", encoding="utf-8",
+                                    buffering=1)
+                atexit.register(self._log_fh.close)
+            except Exception:
+                self._log_fh = None
         self.running = True
-        self.icon: pystray.Icon | None = None
+        self._wake = threading.Event()
+        self.icon = None  # pystray.Icon, created in run()
         self._last_alert: dict[str, float] = {}
+        self._check_cache: tuple | None = None  # (mtime_ns, size, owners)
+        self._last_tooltip: str = ""
+        self._next_backup_mono = self._compute_backup_deadline()
+        # Checks and backups run here so the checker loop never blocks on
+        # profile parsing or a multi-second backup walk; one worker keeps
+        # them serialized.
+        self._worker = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="companion-check")
+        # Menu callbacks share a small pool instead of spawning a fresh
+        # thread per click.
+        self._ui_pool = ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="companion-ui")
+        self._backup_lock = threading.Lock()
         self._stale_count = 0
         self._total_count = 0
         self._seconds_until_check = 0
 
     def _log(self, msg: str):
+        if self._log_fh is None:
+            return
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        line = f"[{timestamp}] {msg}"
-        if self.log_file:
+        line = f"[{timestamp}] {msg}\n"
+        with self._log_lock:
             try:
-                with open(self.log_file, "a", encoding="utf-8") as f:
-                    f.write(line + "\n")
-            except Exception:
-                pass
+                self._log_fh.write(line)
+            except (OSError, ValueError):
+                # Reopen once (e.g. the file was rotated away under us);
+                # give up silently like the old per-line open did.
+                try:
+                    self._log_fh = open(self.log_file, "a",
+                                        encoding="utf-8", buffering=1)
+                    self._log_fh.write(line)
+                except Exception:
+                    self._log_fh = None
 
     def _update_tooltip(self):
         if not self.icon:
             return
         mins_left = max(0, self._seconds_until_check) // 60
-        secs_left = max(0, self._seconds_until_check) % 60
         if self._stale_count > 0:
             status = f"{self._stale_count} token(s) need attention"
         elif self._total_count > 0:
             status = f"All {self._total_count} token(s) OK"
         else:
             status = "Starting..."
-        self.icon.title = f"{APP_NAME}\n{status}\nNext check: {mins_left}m {secs_left:02d}s"
+        title = f"{APP_NAME}\n{status}\nNext check: {mins_left}m"
+        # Setting icon.title is a Shell_NotifyIcon IPC call; skip it when
+        # nothing visible has changed.
+        if title != self._last_tooltip:
+            self.icon.title = title
+            self._last_tooltip = title
 
     def _set_icon_state(self, state: str):
         if self.icon:
@@ -584,14 +916,26 @@ class CompanionApp:
 
     def do_check(self, notify: bool = True) -> bool:
         try:
-            owners = check_profile(self.profile_path, self.warn_days, debug=False)
+            # Skip the XML/DB parse when the profile file hasn't changed;
+            # days_ago is recomputed from the cached timestamps so owners
+            # still age across checks.
+            st = self.profile_path.stat()
+            key = (st.st_mtime_ns, st.st_size)
+            if self._check_cache is not None and self._check_cache[:2] == key:
+                now_ms = time.time() * 1000
+                ms_per_day = 24 * 60 * 60 * 1000
+                owners = [(n, ms, (now_ms - ms) / ms_per_day)
+                          for n, ms, _d in self._check_cache[2]]
+            else:
+                owners = check_profile(self.profile_path, self.warn_days, debug=False)
+                self._check_cache = (*key, owners)
             stale = [(n, ms, d) for n, ms, d in owners if d >= self.warn_days]
             self._total_count = len(owners)
             self._stale_count = len(stale)
 
             if stale:
                 now = time.time()
-                reminder_seconds = self.cfg.get("reminder_hours", 24) * 3600
+                reminder_seconds = self.cfg.reminder_hours * 3600
                 due = [
                     (name, days_ago)
                     for name, _ms, days_ago in stale
@@ -622,99 +966,147 @@ class CompanionApp:
         show_status_window(
             self.profile_path, self.warn_days, cfg=self.cfg,
             on_launch=lambda: open_jeveassets(self.cfg),
-            on_settings=lambda: show_settings_dialog(self.cfg, on_save=self._apply_settings),
+            on_settings=lambda: show_settings_dialog(
+                self.cfg, on_save=self._apply_settings,
+                backup_fn=self._do_backup),
         )
 
     def _apply_settings(self, new_cfg):
         self.cfg = new_cfg
-        self.warn_days = new_cfg["warn_days"]
-        self.check_interval = new_cfg["check_interval"]
-        self._seconds_until_check = min(self._seconds_until_check, self.check_interval)
+        _jar_cache.clear()
+        self.warn_days = new_cfg.warn_days
+        self.check_interval = new_cfg.check_interval
+        self._next_backup_mono = self._compute_backup_deadline()
         self.do_check(notify=False)
         self._update_tooltip()
+        self._wake.set()
+
+    def _compute_backup_deadline(self) -> float:
+        """
+        Monotonic deadline for the next scheduled backup, derived from
+        last_backup_time once instead of re-parsing it every check.
+        """
+        interval = self.cfg.backup_interval_hours * 3600
+        last_dt = self.cfg._last_backup_dt
+        if last_dt is None:
+            return time.monotonic()  # never backed up -> due now
+        if last_dt.tzinfo is None:
+            last_dt = last_dt.replace(tzinfo=timezone.utc)
+        remaining = last_dt.timestamp() + interval - time.time()
+        return time.monotonic() + max(0.0, remaining)
 
     def _try_scheduled_backup(self):
-        if not self.cfg.get("backup_enabled", True):
-            return
-        if not self.cfg.get("backup_dir", "").strip():
-            return
-        interval = self.cfg.get("backup_interval_hours", 24)
-        last = self.cfg.get("last_backup_time", "")
-        if should_backup(last, interval):
+        # The checker loop owns the deadline and has already pushed it to
+        # the retry cadence before submitting; a successful backup pushes
+        # it out by the full interval via _do_backup.
+        if self.cfg.backup_enabled and self.cfg.backup_dir.strip():
             self._do_backup(notify=True)
 
     def _checker_loop(self):
-        self.do_check(notify=True)
-        self._try_scheduled_backup()
+        self._worker.submit(self.do_check, True)
+        self._ui_pool.submit(self._show_status)
+        # Sleep on an Event until the nearest deadline (next check or next
+        # tooltip refresh) instead of waking every second; _on_quit and
+        # _apply_settings set the event to interrupt the wait immediately.
+        next_check = time.monotonic() + self.check_interval
+        # The tooltip only shows whole minutes, so refresh it when the
+        # countdown crosses a minute boundary rather than every 5 seconds.
+        next_tip = time.monotonic() + (self.check_interval % 60 or 60)
         self._seconds_until_check = self.check_interval
-        threading.Thread(target=self._show_status, daemon=True).start()
         while self.running:
-            time.sleep(1)
-            self._seconds_until_check -= 1
-            if self._seconds_until_check % 5 == 0:
-                self._update_tooltip()
-            if self._seconds_until_check <= 0:
+            timeout = max(0.0, min(next_check, next_tip,
+                                   self._next_backup_mono) - time.monotonic())
+            if self._wake.wait(timeout):
+                self._wake.clear()
+                if not self.running:
+                    break
+                # Settings may have shortened the check interval.
+                next_check = min(next_check,
+                                 time.monotonic() + self.check_interval)
+            now = time.monotonic()
+            if now >= next_check:
                 if self.running:
-                    self.do_check(notify=True)
-                    self._try_scheduled_backup()
-                self._seconds_until_check = self.check_interval
+                    self._worker.submit(self.do_check, True)
+                next_check = now + self.check_interval
+            if now >= self._next_backup_mono and self.running:
+                # Assume the retry cadence up front so the loop doesn't
+                # resubmit while the worker is still backing up.
+                self._next_backup_mono = now + self.check_interval
+                self._worker.submit(self._try_scheduled_backup)
+            if now >= next_tip:
+                next_tip = now + ((next_check - now) % 60 or 60)
+            self._seconds_until_check = max(0, int(next_check - now))
+            self._update_tooltip()
 
     # -- menu callbacks -----------------------------------------------------
 
     def _on_show_status(self, _icon, _item):
-        threading.Thread(target=self._show_status, daemon=True).start()
+        self._ui_pool.submit(self._show_status)
 
     def _get_data_dir(self) -> Path:
-        data_dir_str = self.cfg.get("data_dir", "").strip()
+        data_dir_str = self.cfg.data_dir.strip()
         return Path(data_dir_str) if data_dir_str else _default_profile_dir()
 
     def _do_backup(self, notify: bool = True) -> bool:
-        backup_dir = self.cfg.get("backup_dir", "").strip()
-        if not backup_dir:
-            self._log("Backup skipped: no backup directory configured")
+        if not self._backup_lock.acquire(blocking=False):
+            self._log("Backup skipped: another backup is already running")
             return False
+        try:
+            backup_dir = self.cfg.backup_dir.strip()
+            if not backup_dir:
+                self._log("Backup skipped: no backup directory configured")
+                return False
 
-        data_dir = self._get_data_dir()
-        result = run_backup(data_dir, Path(backup_dir))
+            data_dir = self._get_data_dir()
+            result = run_backup(data_dir, Path(backup_dir))
 
-        if result["error"]:
-            self._log(f"Backup failed: {result['error']}")
-            if notify:
-                show_notification("Backup Failed", result["error"])
-            return False
+            if result["error"]:
+                self._log(f"Backup failed: {result['error']}")
+                if notify:
+                    show_notification("Backup Failed", result["error"])
+                return False
 
-        cleanup_old_backups(Path(backup_dir))
-        now_iso = datetime.now(timezone.utc).isoformat()
-        self.cfg["last_backup_time"] = now_iso
-        save_config(self.cfg)
-
-        size_mb = result["total_bytes"] / (1024 * 1024)
-        self._log(f"Backup complete: {result['file_count']} files, {size_mb:.1f} MB -> {result['dest']}")
-        if notify:
-            show_notification(
-                "Backup Complete",
-                f"{result['file_count']} files ({size_mb:.1f} MB) backed up.",
-            )
-        return True
+            cleanup_old_backups(Path(backup_dir))
+            now_dt = datetime.now(timezone.utc)
+            self.cfg.last_backup_time = now_dt.isoformat()
+            self.cfg._last_backup_dt = now_dt
+            save_config(self.cfg)
+            # Push the scheduled deadline out, including for "Backup Now".
+            self._next_backup_mono = self._compute_backup_deadline()
+
+            size_mb = result["total_bytes"] / (1024 * 1024)
+            self._log(f"Backup complete: {result['file_count']} files, {size_mb:.1f} MB -> {result['dest']}")
+            if notify:
+                show_notification(
+                    "Backup Complete",
+                    f"{result['file_count']} files ({size_mb:.1f} MB) backed up.",
+                )
+            return True
+        finally:
+            self._backup_lock.release()
 
     def _on_backup_now(self, _icon, _item):
-        threading.Thread(target=self._do_backup, daemon=True).start()
+        self._ui_pool.submit(self._do_backup)
 
     def _on_open_jeveassets(self, _icon, _item):
-        threading.Thread(target=lambda: open_jeveassets(self.cfg), daemon=True).start()
+        self._ui_pool.submit(open_jeveassets, self.cfg)
 
     def _on_settings(self, _icon, _item):
-        threading.Thread(
-            target=lambda: show_settings_dialog(self.cfg, on_save=self._apply_settings),
-            daemon=True,
-        ).start()
+        self._ui_pool.submit(
+            show_settings_dialog, self.cfg, on_save=self._apply_settings,
+            backup_fn=self._do_backup)
 
     def _on_quit(self, icon, _item):
         self.running = False
+        self._wake.set()
+        self._worker.shutdown(wait=False)
+        self._ui_pool.shutdown(wait=False)
         icon.stop()
 
     def run(self):
-        jar_label = "jmemory.jar" if self.cfg.get("use_jmem") else "jeveassets.jar"
+        import pystray
+
+        jar_label = "jmemory.jar" if self.cfg.use_jmem else "jeveassets.jar"
         menu = pystray.Menu(
             pystray.MenuItem("Show Status", self._on_show_status, default=True),
             pystray.MenuItem(f"Open jEveAssets ({jar_label})", self._on_open_jeveassets),
@@ -742,10 +1134,10 @@ class CompanionApp:
 # ---------------------------------------------------------------------------
 
 def cli_check(args, cfg):
-    data_dir_str = args.data_dir or cfg.get("data_dir", "").strip()
+    data_dir_str = args.data_dir or cfg.data_dir.strip()
     profile_dir = Path(data_dir_str) if data_dir_str else _default_profile_dir()
     profile_path = _find_profile_file(profile_dir)
-    days = args.days if args.days is not None else cfg.get("warn_days", DEFAULT_WARN_DAYS)
+    days = args.days if args.days is not None else cfg.warn_days
 
     if profile_path is None:
         if not args.quiet:
@@ -817,6 +1209,13 @@ def main():
         return
 
     # ----- Tray mode (default) -----
+    try:
+        import pystray  # noqa: F401
+        import PIL  # noqa: F401
+    except ImportError:
+        print("Missing dependencies. Install with:  pip install pystray pillow", file=sys.stderr)
+        sys.exit(1)
+
     if not _acquire_single_instance():
         ctypes.windll.user32.MessageBoxW(
             0,
@@ -828,12 +1227,12 @@ def main():
         sys.exit(0)
 
     if args.check_interval:
-        cfg["check_interval"] = args.check_interval
+        cfg.check_interval = args.check_interval
     if args.days is not None:
-        cfg["warn_days"] = args.days
+        cfg.warn_days = args.days
 
     def _resolve_profile(cfg, args):
-        data_dir_str = str(args.data_dir) if args.data_dir else cfg.get("data_dir", "").strip()
+        data_dir_str = str(args.data_dir) if args.data_dir else cfg.data_dir.strip()
         profile_dir = Path(data_dir_str) if data_dir_str else _default_profile_dir()
         return _find_profile_file(profile_dir), profile_dir
 
@@ -12,23 +12,53 @@ CLI fallback and matches the main app default in companion_app.py.
 
 from __future__ import annotations
 
+import atexit
 import os
 import sys
+import time
 import sqlite3
 import xml.etree.ElementTree as ET
+from functools import lru_cache
 from pathlib import Path
-from datetime import datetime, timezone
+from datetime import datetime
+from urllib.parse import quote
+
+# lxml's libxml2 backend parses noticeably faster than stdlib
+# ElementTree and its iterparse can filter by tag in C; used when
+# installed, with the stdlib as the fallback.
+try:
+    from lxml import etree as _lxml_etree
+except ImportError:
+    _lxml_etree = None
 
 DEFAULT_WARN_DAYS = 14
 
+_MS_PER_DAY = 24 * 60 * 60 * 1000
+
+# Cached: expanduser does a registry/passwd lookup, and neither HOME nor
+# JEVEASSETS_DATA changes mid-run.
+@lru_cache(maxsize=1)
 def _default_profile_dir():
     base = os.environ.get("JEVEASSETS_DATA", os.path.expanduser("~"))
     return Path(base) / ".jeveassets"
 
+# Resolved profile path per profiles directory, keyed by the directory's
+# mtime.  Probing the five candidate names costs a stat() each, which
+# adds up when the tray loop re-resolves over a network-mapped
+# .jeveassets; a rename/replace in the directory bumps its mtime and
+# invalidates the entry.
+_PROFILE_CACHE: dict[str, tuple[int, Path | None]] = {}
+
 def _find_profile_file(profile_dir: Path) -> Path | None:
     profiles = profile_dir / "profiles"
-    if not profiles.exists():
+    try:
+        dir_mtime_ns = profiles.stat().st_mtime_ns
+    except OSError:
         return None
+    key = str(profiles)
+    cached = _PROFILE_CACHE.get(key)
+    if cached is not None and cached[0] == dir_mtime_ns:
+        return cached[1]
     candidates = [
         "#Default.db",
         "#Default.xml",
@@ -36,11 +66,14 @@ def _find_profile_file(profile_dir: Path) -> Path | None:
         "Default.db",
         "Default.xml",
     ]
+    found = None
     for name in candidates:
         p = profiles / name
         if p.exists():
-            return p
-    return None
+            found = p
+            break
+    _PROFILE_CACHE[key] = (dir_mtime_ns, found)
+    return found
 
 # XML attributes on <esiowner> that hold "last update" timestamps (epoch ms).
 # *nextupdate attributes are intentionally excluded -- they are future timestamps.
@@ -49,28 +82,110 @@ LAST_UPDATE_ATTRS = (
     "balancelastupdate",
 )
 
-def _get_last_update_ms(esiowner: ET.Element) -> int | None:
-    latest = None
-    for attr in LAST_UPDATE_ATTRS:
-        val = esiowner.get(attr)
-        if val and val.isdigit():
-            ts = int(val)
-            if latest is None or ts > latest:
-                latest = ts
-    return latest
+_XML_READ_BLOCK = 64 * 1024
 
-def check_profile_db(profile_path: Path, warn_days: int = 0, debug: bool = False) -> list[tuple[str, int, float]]:
+class _OwnerCollector:
     """
-    Read profile from SQLite database and return list of (name, last_update_ms, days_ago).
-    warn_days is accepted for interface consistency but filtering is done by the caller.
+    Minimal XMLParser target: captures (name, last_ms) per valid
+    <esiowner> straight from the attribute dict, without constructing
+    Element objects for the rest of the document.
     """
-    conn = sqlite3.connect(profile_path)
-    cursor = conn.cursor()
-
-    now_ms = int(datetime.now(timezone.utc).timestamp() * 1000)
-    ms_per_day = 24 * 60 * 60 * 1000
-    results = []
 
+    __slots__ = ("owners",)
+
+    def __init__(self):
+        self.owners: list[tuple[str, int]] = []
+
+    # int is bound as a default so the per-element call is a LOAD_FAST
+    # rather than a builtins lookup.
+    def start(self, tag, attrib, _int=int):
+        if tag != "esiowner" or attrib.get("invalid") == "true":
+            return
+        # Unrolled scan of LAST_UPDATE_ATTRS (a 2-tuple): runs once per
+        # owner, so no loop or helper call on the hot path.  int() does
+        # the validation itself in C; valid timestamps (the common case)
+        # never pay for a separate isdigit() walk.  None (not 0) marks
+        # "no timestamp" so a literal "0" still yields a maximally
+        # stale row instead of hiding the owner.
+        a = attrib.get("assetslastupdate")
+        b = attrib.get("balancelastupdate")
+        try:
+            a_ms = _int(a) if a else None
+        except ValueError:
+            a_ms = None
+        try:
+            b_ms = _int(b) if b else None
+        except ValueError:
+            b_ms = None
+        if a_ms is None:
+            last_ms = b_ms
+        elif b_ms is None or a_ms >= b_ms:
+            last_ms = a_ms
+        else:
+            last_ms = b_ms
+        if last_ms is not None:
+            name = attrib.get("name") or attrib.get("accountname") or "Unknown"
+            self.owners.append((name, last_ms))
+
+    def close(self):
+        return self.owners
+
+# One read-only connection per profile path, reopened when the file is
+# rewritten (jEveAssets replaces it, so a handle to the old inode would
+# serve stale data).  mode=ro keeps SQLite from creating journal files;
+# immutable=1 is deliberately NOT used because the profile does change
+# between checks.
+_CONN_CACHE: dict[str, tuple[int, sqlite3.Connection]] = {}
+
+def _get_ro_connection(profile_path: Path, mtime_ns: int) -> sqlite3.Connection:
+    key = str(profile_path)
+    cached = _CONN_CACHE.get(key)
+    if cached is not None:
+        if cached[0] == mtime_ns:
+            return cached[1]
+        try:
+            cached[1].close()
+        except sqlite3.Error:
+            pass
+    # Percent-encode the path: jEveAssets profiles start with "#", which
+    # a URI would otherwise treat as the fragment separator.
+    encoded = quote(key, safe="/:\\")
+    conn = sqlite3.connect(f"file:{encoded}?mode=ro",
+                           uri=True, check_same_thread=False)
+    # Read-tuned pragmas, paid once per open: mmap turns the small
+    # owners read into page-cache copies, and busy_timeout rides out
+    # jEveAssets writing the profile mid-check.
+    for pragma in ("query_only=1", "mmap_size=268435456",
+                   "temp_store=MEMORY", "cache_size=-20000",
+                   "busy_timeout=2000"):
+        conn.execute(f"PRAGMA {pragma}")
+    _CONN_CACHE[key] = (mtime_ns, conn)
+    return conn
+
+def _close_connections():
+    for _mtime, conn in _CONN_CACHE.values():
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+    _CONN_CACHE.clear()
+
+atexit.register(_close_connections)
+
+# Candidate identifiers probed during schema discovery, in preference
+# order.  Matched case-insensitively against the live schema.
+_TABLE_CANDIDATES = ("esiowners", "owners", "accounts", "esi_owners")
+_NAME_CANDIDATES = ("name", "accountname", "character_name")
+_INVALID_CANDIDATES = ("invalid", "is_invalid", "disabled")
+_TS_FALLBACK_HINTS = ("update", "timestamp", "last", "time")
+
+# Resolved (select_cols, name_col, invalid_col, timestamp_cols, query)
+# per (path, mtime_ns), or None when the database has no usable table.
+# Schema discovery costs several SQLite round-trips and only changes
+# when jEveAssets rewrites the file.
+_SCHEMA_CACHE: dict[tuple[str, int], tuple | None] = {}
+
+def _discover_schema(cursor, debug: bool = False) -> tuple | None:
     cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
     tables = [row[0] for row in cursor.fetchall()]
 
@@ -78,7 +193,7 @@ def check_profile_db(profile_path: Path, warn_days: int = 0, debug: bool = False
         print(f"DEBUG: Found tables: {tables}", file=sys.stderr)
 
     esi_table = None
-    for table_name in ["esiowners", "owners", "accounts", "esi_owners"]:
+    for table_name in _TABLE_CANDIDATES:
         if table_name in tables:
             esi_table = table_name
             break
@@ -86,8 +201,7 @@ def check_profile_db(profile_path: Path, warn_days: int = 0, debug: bool = False
     if esi_table is None:
         if debug:
             print(f"DEBUG: No ESI owners table found. Available tables: {tables}", file=sys.stderr)
-        conn.close()
-        return results
+        return None
 
     cursor.execute(f"PRAGMA table_info({esi_table})")
     columns = [row[1] for row in cursor.fetchall()]
@@ -95,82 +209,95 @@ def check_profile_db(profile_path: Path, warn_days: int = 0, debug: bool = False
     if debug:
         print(f"DEBUG: Table '{esi_table}' columns: {columns}", file=sys.stderr)
 
+    # Lowercase each column name once; all matching below works on the
+    # lowered forms and maps back to the original spelling for SQL.
+    lowered = [c.lower() for c in columns]
+    columns_set = set(lowered)
+
     name_col = None
-    for col in ["name", "accountname", "character_name"]:
-        if col in columns:
-            name_col = col
+    for col in _NAME_CANDIDATES:
+        if col in columns_set:
+            name_col = columns[lowered.index(col)]
             break
 
     invalid_col = None
-    for col in ["invalid", "is_invalid", "disabled"]:
-        if col in columns:
-            invalid_col = col
+    for col in _INVALID_CANDIDATES:
+        if col in columns_set:
+            invalid_col = columns[lowered.index(col)]
             break
 
-    timestamp_cols = []
-    for col in columns:
-        if "lastupdate" in col.lower() and "next" not in col.lower():
-            timestamp_cols.append(col)
+    timestamp_cols = [col for col, lc in zip(columns, lowered)
+                      if "lastupdate" in lc and "next" not in lc]
 
     if not timestamp_cols:
-        for col in columns:
-            if any(x in col.lower() for x in ["update", "timestamp", "last", "time"]):
-                if "next" not in col.lower():
-                    timestamp_cols.append(col)
+        timestamp_cols = [col for col, lc in zip(columns, lowered)
+                          if "next" not in lc
+                          and any(x in lc for x in _TS_FALLBACK_HINTS)]
 
     if debug:
         print(f"DEBUG: Using name column: {name_col}, timestamp columns: {timestamp_cols}", file=sys.stderr)
 
-    select_cols = []
-    if name_col:
-        select_cols.append(name_col)
-    if invalid_col:
-        select_cols.append(invalid_col)
-    select_cols.extend(timestamp_cols)
-
-    if not select_cols:
-        conn.close()
-        return results
+    if not timestamp_cols:
+        return None
 
-    query = f"SELECT {', '.join(select_cols)} FROM {esi_table}"
-    cursor.execute(query)
+    # Push the per-row work into SQLite: the scalar MAX picks the newest
+    # timestamp in C (COALESCE+CAST turns NULL/garbage into 0, filtered
+    # by the outer WHERE), and invalid owners never cross the boundary.
+    name_expr = f"COALESCE({name_col}, 'Unknown')" if name_col else "'Unknown'"
+    ts_exprs = ", ".join(
+        f"CAST(COALESCE({col}, 0) AS INTEGER)" for col in timestamp_cols)
+    last_expr = f"MAX({ts_exprs})" if len(timestamp_cols) > 1 else ts_exprs
+    inner = f"SELECT {name_expr} AS name, {last_expr} AS last_ms FROM {esi_table}"
+    if invalid_col:
+        inner += (f" WHERE ({invalid_col} IS NULL"
+                  f" OR {invalid_col} = 0 OR {invalid_col} = '')")
+    query = f"SELECT name, last_ms FROM ({inner}) WHERE last_ms > 0"
+    return (name_col, invalid_col, timestamp_cols, query)
 
-    for row in cursor.fetchall():
-        row_dict = dict(zip(select_cols, row))
+def check_profile_db(profile_path: Path, warn_days: int = 0, debug: bool = False) -> list[tuple[str, int, float]]:
+    """
+    Read profile from SQLite database and return list of (name, last_update_ms, days_ago).
+    warn_days is accepted for interface consistency but filtering is done by the caller.
+    """
+    mtime_ns = profile_path.stat().st_mtime_ns
+    conn = _get_ro_connection(profile_path, mtime_ns)
+    cursor = conn.cursor()
 
-        if invalid_col and row_dict.get(invalid_col):
-            continue
+    now_ms = time.time_ns() // 1_000_000
+    results = []
 
-        name = row_dict.get(name_col) or "Unknown"
+    key = (str(profile_path), mtime_ns)
+    if key in _SCHEMA_CACHE and not debug:
+        plan = _SCHEMA_CACHE[key]
+    else:
+        plan = _discover_schema(cursor, debug)
+        if len(_SCHEMA_CACHE) > 8:
+            _SCHEMA_CACHE.clear()
+        _SCHEMA_CACHE[key] = plan
 
-        last_ms = None
-        for col in timestamp_cols:
-            val = row_dict.get(col)
-            if val and isinstance(val, (int, str)):
-                try:
-                    ts = int(val)
-                    if last_ms is None or ts > last_ms:
-                        last_ms = ts
-                except (ValueError, TypeError):
-                    pass
+    if plan is None:
+        return results
 
-        if last_ms is None:
-            continue
+    _name_col, _invalid_col, _timestamp_cols, query = plan
+    # Iterate the cursor instead of fetchall(): rows stream out of the C
+    # layer in arraysize batches without materializing the full list.
+    cursor.arraysize = 64
+    cursor.execute(query)
 
+    for name, last_ms in cursor:
         if debug:
+            # One stderr write per owner instead of one per line; the
+            # datetime is only built on this branch.
             last_dt = datetime.fromtimestamp(last_ms / 1000)
-            print(f"DEBUG {name}:", file=sys.stderr)
-            print(f"  last_ms: {last_ms}  ({last_dt})", file=sys.stderr)
-            print(f"  now_ms:  {now_ms}", file=sys.stderr)
-            for col in timestamp_cols:
-                print(f"  {col}: {row_dict.get(col)}", file=sys.stderr)
-
-        days_ago = (now_ms - last_ms) / ms_per_day
-        if days_ago < 0:
+            sys.stderr.write(f"DEBUG {name}:\n"
+                             f"  last_ms: {last_ms}  ({last_dt})\n"
+                             f"  now_ms:  {now_ms}\n")
+
+        age_ms = now_ms - last_ms
+        if age_ms < 0:
             continue
-        results.append((name, last_ms, days_ago))
+        results.append((name, last_ms, age_ms / _MS_PER_DAY))
 
-    conn.close()
     return results
 
 def check_profile_xml(profile_path: Path, warn_days: int = 0, debug: bool = False) -> list[tuple[str, int, float]]:
@@ -179,50 +306,103 @@ def check_profile_xml(profile_path: Path, warn_days: int = 0, debug: bool = Fals
     Only includes owners that have a last-update and are not marked invalid.
     warn_days is accepted for interface consistency but filtering is done by the caller.
     """
-    tree = ET.parse(profile_path)
-    root = tree.getroot()
-    now_ms = int(datetime.now(timezone.utc).timestamp() * 1000)
-    ms_per_day = 24 * 60 * 60 * 1000
+    now_ms = time.time_ns() // 1_000_000
     results = []
 
-    esiowners = root.find(".//esiowners")
-    if esiowners is None:
-        return results
-
-    for owner in esiowners.findall("esiowner"):
-        if owner.get("invalid") == "true":
-            continue
-        name = owner.get("name") or owner.get("accountname") or "Unknown"
-        last_ms = _get_last_update_ms(owner)
+    # Default-arg bindings turn the global/builtin lookups into
+    # LOAD_FASTs for the per-owner loop.
+    def handle_owner(elem, _attrs=LAST_UPDATE_ATTRS, _int=int):
+        if elem.get("invalid") == "true":
+            return
+        name = elem.get("name") or elem.get("accountname") or "Unknown"
+        # None (not 0) is the "no timestamp" sentinel: a literal "0"
+        # must still produce a (maximally stale) row.
+        last_ms = None
+        for attr in _attrs:
+            val = elem.get(attr)
+            if not val:
+                continue
+            try:
+                ts = _int(val)
+            except ValueError:
+                continue
+            if last_ms is None or ts > last_ms:
+                last_ms = ts
         if last_ms is None:
-            continue
-
+            return
         if debug:
+            # Collected into one stderr write per owner; the datetime is
+            # only built on this branch.
             last_dt = datetime.fromtimestamp(last_ms / 1000)
-            print(f"DEBUG {name}:", file=sys.stderr)
-            print(f"  last_ms: {last_ms}  ({last_dt})", file=sys.stderr)
-            print(f"  now_ms:  {now_ms}", file=sys.stderr)
+            lines = [f"DEBUG {name}:",
+                     f"  last_ms: {last_ms}  ({last_dt})",
+                     f"  now_ms:  {now_ms}"]
             for attr in LAST_UPDATE_ATTRS:
-                val = owner.get(attr)
+                val = elem.get(attr)
                 if val:
-                    print(f"  {attr}: {val}", file=sys.stderr)
-
-        days_ago = (now_ms - last_ms) / ms_per_day
-        if days_ago < 0:
-            continue
-        results.append((name, last_ms, days_ago))
+                    lines.append(f"  {attr}: {val}")
+            lines.append("")
+            sys.stderr.write("\n".join(lines))
+        age_ms = now_ms - last_ms
+        if age_ms >= 0:
+            results.append((name, last_ms, age_ms / _MS_PER_DAY))
+
+    # Stream the file instead of materializing the whole DOM: profiles
+    # carry large history payloads we never look at, so each element is
+    # processed on its end tag and cleared immediately.  Memory stays
+    # proportional to one owner rather than the whole profile.
+    if _lxml_etree is not None:
+        # The tag filter skips non-matching elements entirely in C; the
+        # clear + delete-previous-siblings dance frees processed parts
+        # of the tree as parsing advances.
+        for _event, elem in _lxml_etree.iterparse(
+                str(profile_path), events=("end",), tag="esiowner"):
+            handle_owner(elem)
+            elem.clear(keep_tail=True)
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+    elif not debug:
+        # Fast path: a target parser skips Element construction
+        # entirely; owner attributes are read from the raw dicts.
+        collector = _OwnerCollector()
+        parser = ET.XMLParser(target=collector)
+        with open(profile_path, "rb") as f:
+            while chunk := f.read(_XML_READ_BLOCK):
+                parser.feed(chunk)
+        parser.close()
+        for name, last_ms in collector.owners:
+            age_ms = now_ms - last_ms
+            if age_ms >= 0:
+                results.append((name, last_ms, age_ms / _MS_PER_DAY))
+    else:
+        # Debug keeps the Element-based walk for its per-attribute dump.
+        for _event, elem in ET.iterparse(str(profile_path), events=("end",)):
+            if elem.tag == "esiowner":
+                handle_owner(elem)
+                elem.clear()
+            elif elem.tag == "esiowners":
+                # Drop references to the already-cleared children.
+                elem.clear()
 
     return results
 
+# Chosen handler per profile path: the tray loop dispatches on the same
+# file every tick, so the suffix parse and compare run once per path.
+_HANDLER_CACHE: dict[Path, object] = {}
+
 def check_profile(profile_path: Path, warn_days: int, debug: bool = False) -> list[tuple[str, int, float]]:
     """Check profile file - supports both database (.db) and XML formats."""
-    if profile_path.suffix.lower() == '.db':
-        return check_profile_db(profile_path, warn_days, debug)
-    else:
-        return check_profile_xml(profile_path, warn_days, debug)
+    handler = _HANDLER_CACHE.get(profile_path)
+    if handler is None:
+        handler = (check_profile_db if profile_path.suffix.lower() == '.db'
+                   else check_profile_xml)
+        _HANDLER_CACHE[profile_path] = handler
+    return handler(profile_path, warn_days, debug)
 
 if __name__ == "__main__":
     import argparse
+    import functools
+    from operator import itemgetter
     p = argparse.ArgumentParser(description="Check jEveAssets ESI token freshness.")
     p.add_argument("--days", type=int, default=DEFAULT_WARN_DAYS,
                     help=f"Alert if no update in this many days (default: {DEFAULT_WARN_DAYS})")
@@ -232,36 +412,47 @@ if __name__ == "__main__":
     p.add_argument("--debug", action="store_true", help="Show debug timestamp details.")
     args = p.parse_args()
 
+    # Bound once: --quiet swaps both helpers for a no-op, so the rest of
+    # the block just calls them instead of re-testing the flag per line.
+    if args.quiet:
+        say = err = lambda *a, **k: None
+    else:
+        say = print
+        err = functools.partial(print, file=sys.stderr)
+
     profile_dir = args.data_dir or _default_profile_dir()
     profile_path = _find_profile_file(profile_dir)
 
     if profile_path is None:
-        if not args.quiet:
-            print("No profile found.", file=sys.stderr)
-            print(f"  Looked in: {profile_dir / 'profiles'}", file=sys.stderr)
+        err("No profile found.")
+        err(f"  Looked in: {profile_dir / 'profiles'}")
         sys.exit(2)
 
-    if not args.quiet:
-        print(f"Using profile: {profile_path} ({'database' if profile_path.suffix == '.db' else 'XML'})", file=sys.stderr)
+    err(f"Using profile: {profile_path} ({'database' if profile_path.suffix == '.db' else 'XML'})")
 
     owners = check_profile(profile_path, args.days, debug=args.debug)
     if not owners:
-        if not args.quiet:
-            print("No ESI owners found in profile (or all invalid).")
+        say("No ESI owners found in profile (or all invalid).")
         sys.exit(0)
 
-    owners.sort(key=lambda x: x[2], reverse=True)
-    stale = [(n, ms, d) for n, ms, d in owners if d >= args.days]
+    # itemgetter is a C-level key; the partition is one pass instead of
+    # a filtering comprehension per bucket.
+    owners.sort(key=itemgetter(2), reverse=True)
+    stale, fresh = [], []
+    for owner in owners:
+        (stale if owner[2] >= args.days else fresh).append(owner)
 
+    # Each report is joined into a single string and emitted with one
+    # call -- one write instead of one per owner, which keeps slow
+    # terminals (Windows conhost) from flickering line by line.
     if stale:
-        if not args.quiet:
-            print(f"\n  {len(stale)} character(s) stale (>{args.days} days):\n")
-            for name, _ms, days_ago in stale:
-                print(f"    - {name}: {days_ago:.0f} days ago")
-            print()
+        lines = [f"\n  {len(stale)} character(s) stale (>{args.days} days):\n"]
+        lines.extend(f"    - {name}: {days_ago:.0f} days ago"
+                     for name, _ms, days_ago in stale)
+        lines.append("")
+        say("\n".join(lines))
         sys.exit(1)
 
-    if not args.quiet:
-        for name, _ms, days_ago in owners:
-            print(f"  {name}: OK ({days_ago:.0f} days ago)")
+    say("\n".join(f"  {name}: OK ({days_ago:.0f} days ago)"
+                  for name, _ms, days_ago in fresh))
     sys.exit(0)